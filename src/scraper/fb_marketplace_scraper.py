@@ -10,6 +10,7 @@ import json
 import logging
 import psutil
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union, Generator
 from pathlib import Path
@@ -34,6 +35,34 @@ from src.utils.config import Config
 from src.database.db_manager import DatabaseManager
 
 
+@dataclass
+class ScraperStats:
+    """Counters and resource readings for a scraping session"""
+    
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "listings_found", "new_listings", "updated_listings", "errors",
+        "memory_usage_mb", "cpu_usage"
+    )
+    
+    listings_found: int
+    new_listings: int
+    updated_listings: int
+    errors: int
+    memory_usage_mb: float
+    cpu_usage: float
+    
+    @classmethod
+    def zero(cls) -> "ScraperStats":
+        """
+        Create stats for a session that hasn't started
+        
+        Returns:
+            ScraperStats: Stats with every counter at zero
+        """
+        return cls(0, 0, 0, 0, 0.0, 0.0)
+
+
 class ResourceEfficientScraper:
     """A memory-efficient scraper for Facebook Marketplace car listings"""
     
@@ -64,14 +93,7 @@ class ResourceEfficientScraper:
         self.processed_urls = set()
         
         # Stats for reporting
-        self.stats = {
-            "listings_found": 0,
-            "new_listings": 0,
-            "updated_listings": 0,
-            "errors": 0,
-            "memory_usage_mb": 0,
-            "cpu_usage": 0
-        }
+        self.stats = ScraperStats.zero()
     
     def _setup_driver(self):
         """
@@ -146,8 +168,8 @@ class ResourceEfficientScraper:
         cpu_usage = psutil.cpu_percent(interval=0.1)
         
         # Update stats
-        self.stats["memory_usage_mb"] = memory_usage_mb
-        self.stats["cpu_usage"] = cpu_usage
+        self.stats.memory_usage_mb = memory_usage_mb
+        self.stats.cpu_usage = cpu_usage
         
         return memory_usage_mb, cpu_usage
     
@@ -305,7 +327,7 @@ class ResourceEfficientScraper:
                     time.sleep(self.backoff_factor ** attempt)
         
         # All attempts failed
-        self.stats["errors"] += 1
+        self.stats.errors += 1
         return None
     
     def _restart_driver(self):
@@ -691,7 +713,7 @@ class ResourceEfficientScraper:
             
             # Scroll to load listings
             listing_urls = self._scroll_to_load_listings(max_listings)
-            self.stats["listings_found"] = len(listing_urls)
+            self.stats.listings_found = len(listing_urls)
             
             self.logger.info(f"Found {len(listing_urls)} listings. Processing in batches of {self.batch_size}...")
             
@@ -719,9 +741,9 @@ class ResourceEfficientScraper:
             self.db_manager.end_scrape_session(
                 self.session_id,
                 status='completed',
-                listings_found=self.stats["listings_found"],
-                new_listings=self.stats["new_listings"],
-                updated_listings=self.stats["updated_listings"]
+                listings_found=self.stats.listings_found,
+                new_listings=self.stats.new_listings,
+                updated_listings=self.stats.updated_listings
             )
             
         except Exception as e:
@@ -729,9 +751,9 @@ class ResourceEfficientScraper:
             self.db_manager.end_scrape_session(
                 self.session_id,
                 status='failed',
-                listings_found=self.stats["listings_found"],
-                new_listings=self.stats["new_listings"],
-                updated_listings=self.stats["updated_listings"],
+                listings_found=self.stats.listings_found,
+                new_listings=self.stats.new_listings,
+                updated_listings=self.stats.updated_listings,
                 error_message=str(e)
             )
         finally:
@@ -765,9 +787,9 @@ class ResourceEfficientScraper:
                 existing_listing = self.db_manager.get_car_listing(listing_data['id'])
                 
                 if existing_listing:
-                    self.stats["updated_listings"] += 1
+                    self.stats.updated_listings += 1
                 else:
-                    self.stats["new_listings"] += 1
+                    self.stats.new_listings += 1
                 
                 # Save to database
                 self.db_manager.save_car_listing(listing_data)
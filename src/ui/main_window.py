@@ -13,6 +13,7 @@ import platform
 import time
 from datetime import datetime
 import webbrowser
+import functools
 from typing import Dict, List, Optional, Callable
 import psutil
 
@@ -39,6 +40,18 @@ from src.ui.about_frame import AboutFrame
 class MainWindow:
     """Main application window with resource-efficient UI"""
     
+    # Menu actions handled by sub-frames: action -> (frame name, method name)
+    _DELEGATIONS = {
+        "start_scraping": ("scraper", "start_scraping"),
+        "stop_scraping": ("scraper", "stop_scraping"),
+        "view_saved_searches": ("scraper", "show_saved_searches"),
+        "show_scheduler": ("scraper", "show_scheduler"),
+        "show_price_trends": ("analysis", "show_price_trends"),
+        "show_price_mileage": ("analysis", "show_price_mileage"),
+        "show_price_year": ("analysis", "show_price_year"),
+        "export_results": ("analysis", "export_results"),
+    }
+    
     def __init__(self, root: tk.Tk, config: Config, db_manager: DatabaseManager):
         """Initialize the main window with dependencies"""
         self.root = root
@@ -69,6 +82,9 @@ class MainWindow:
             config=config
         )
         
+        # Last values reported by the resource monitor (replayed on restore)
+        self._last_resource_values = None
+        
         # System tray icon (initialized later)
         self.tray_icon = None
         
@@ -117,10 +133,17 @@ class MainWindow:
         # Bind close event
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
+        # Refresh displays once when the window is shown again
+        self.root.bind("<Map>", self._force_refresh)
+        
         # Configure grid layout to expand with window
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
     
+    def _delegation_command(self, action: str) -> Callable:
+        """Build a menu command for an action listed in _DELEGATIONS"""
+        return functools.partial(self._delegate, *self._DELEGATIONS[action])
+    
     def _create_menu(self):
         """Create main application menu"""
         menubar = tk.Menu(self.root)
@@ -137,20 +160,20 @@ class MainWindow:
         
         # Scraper menu
         scraper_menu = tk.Menu(menubar, tearoff=0)
-        scraper_menu.add_command(label="Start Scraping", command=self._start_scraping)
-        scraper_menu.add_command(label="Stop Scraping", command=self._stop_scraping)
+        scraper_menu.add_command(label="Start Scraping", command=self._delegation_command("start_scraping"))
+        scraper_menu.add_command(label="Stop Scraping", command=self._delegation_command("stop_scraping"))
         scraper_menu.add_separator()
-        scraper_menu.add_command(label="View Saved Searches", command=self._view_saved_searches)
-        scraper_menu.add_command(label="Schedule Tasks", command=self._show_scheduler)
+        scraper_menu.add_command(label="View Saved Searches", command=self._delegation_command("view_saved_searches"))
+        scraper_menu.add_command(label="Schedule Tasks", command=self._delegation_command("show_scheduler"))
         menubar.add_cascade(label="Scraper", menu=scraper_menu)
         
         # Analysis menu
         analysis_menu = tk.Menu(menubar, tearoff=0)
-        analysis_menu.add_command(label="Price Trends", command=self._show_price_trends)
-        analysis_menu.add_command(label="Price vs. Mileage", command=self._show_price_mileage)
-        analysis_menu.add_command(label="Price by Year", command=self._show_price_year)
+        analysis_menu.add_command(label="Price Trends", command=self._delegation_command("show_price_trends"))
+        analysis_menu.add_command(label="Price vs. Mileage", command=self._delegation_command("show_price_mileage"))
+        analysis_menu.add_command(label="Price by Year", command=self._delegation_command("show_price_year"))
         analysis_menu.add_separator()
-        analysis_menu.add_command(label="Export Results", command=self._export_results)
+        analysis_menu.add_command(label="Export Results", command=self._delegation_command("export_results"))
         menubar.add_cascade(label="Analysis", menu=analysis_menu)
         
         # Tools menu
@@ -287,12 +310,29 @@ class MainWindow:
     
     def _update_time(self):
         """Update the time display in the status bar"""
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_var.set(current_time)
+        # Skip the update while the window is hidden
+        if not self._is_window_hidden():
+            current_time = datetime.now().strftime("%H:%M:%S")
+            self.time_var.set(current_time)
         
         # Schedule next update in 1 second
         self.root.after(1000, self._update_time)
     
+    def _is_window_hidden(self) -> bool:
+        """Check if the main window is withdrawn to tray or iconified"""
+        return self.root.state() in ("withdrawn", "iconic")
+    
+    def _force_refresh(self, event=None):
+        """Refresh time and resource displays after the window is restored"""
+        # <Map> is also delivered for child widgets, only handle the root
+        if event is not None and event.widget is not self.root:
+            return
+            
+        self.time_var.set(datetime.now().strftime("%H:%M:%S"))
+        
+        if self._last_resource_values:
+            self._update_resource_display(*self._last_resource_values)
+    
     def _show_frame(self, frame_name: str):
         """
         Show the specified frame and hide others
@@ -329,7 +369,8 @@ class MainWindow:
                     self.content_frame, 
                     self.config,
                     self.theme_manager,
-                    self._apply_theme
+                    self._apply_theme,
+                    self.resource_monitor.refresh_config
                 )
             elif frame_name == "about":
                 self.frames[frame_name] = AboutFrame(self.content_frame)
@@ -411,6 +452,13 @@ class MainWindow:
             cpu_percent (float): CPU usage percentage
             is_throttling (bool): Whether throttling is active
         """
+        # Remember values so they can be shown when the window is restored
+        self._last_resource_values = (memory_percent, memory_mb, cpu_percent, is_throttling)
+        
+        # No widget is visible while minimized, so skip all Tk work
+        if self._is_window_hidden():
+            return
+        
         # Update memory progress bar and label
         self.memory_progress["value"] = memory_percent
         self.memory_usage_var.set(f"Memory: {memory_mb:.1f} MB ({memory_percent:.1f}%)")
@@ -501,69 +549,20 @@ class MainWindow:
         theme = self.config.get("ui", "theme", "system")
         self.theme_manager.apply_theme(theme)
     
-    def _start_scraping(self):
-        """Start manual scraping operation"""
-        if self.current_frame == "scraper" and hasattr(self.frames["scraper"], "start_scraping"):
-            self.frames["scraper"].start_scraping()
-        else:
-            self._show_frame("scraper")
-            self.root.after(500, self._start_scraping)
-    
-    def _stop_scraping(self):
-        """Stop any running scraping operation"""
-        if self.current_frame == "scraper" and hasattr(self.frames["scraper"], "stop_scraping"):
-            self.frames["scraper"].stop_scraping()
-        else:
-            self._show_frame("scraper")
-            self.root.after(500, self._stop_scraping)
-    
-    def _view_saved_searches(self):
-        """View saved scraper searches"""
-        if self.current_frame == "scraper" and hasattr(self.frames["scraper"], "show_saved_searches"):
-            self.frames["scraper"].show_saved_searches()
-        else:
-            self._show_frame("scraper")
-            self.root.after(500, self._view_saved_searches)
-    
-    def _show_scheduler(self):
-        """Show scheduler configuration"""
-        if self.current_frame == "scraper" and hasattr(self.frames["scraper"], "show_scheduler"):
-            self.frames["scraper"].show_scheduler()
-        else:
-            self._show_frame("scraper")
-            self.root.after(500, self._show_scheduler)
-    
-    def _show_price_trends(self):
-        """Show price trends analysis"""
-        if self.current_frame == "analysis" and hasattr(self.frames["analysis"], "show_price_trends"):
-            self.frames["analysis"].show_price_trends()
-        else:
-            self._show_frame("analysis")
-            self.root.after(500, self._show_price_trends)
-    
-    def _show_price_mileage(self):
-        """Show price vs mileage analysis"""
-        if self.current_frame == "analysis" and hasattr(self.frames["analysis"], "show_price_mileage"):
-            self.frames["analysis"].show_price_mileage()
-        else:
-            self._show_frame("analysis")
-            self.root.after(500, self._show_price_mileage)
-    
-    def _show_price_year(self):
-        """Show price by year analysis"""
-        if self.current_frame == "analysis" and hasattr(self.frames["analysis"], "show_price_year"):
-            self.frames["analysis"].show_price_year()
-        else:
-            self._show_frame("analysis")
-            self.root.after(500, self._show_price_year)
-    
-    def _export_results(self):
-        """Export analysis results"""
-        if self.current_frame == "analysis" and hasattr(self.frames["analysis"], "export_results"):
-            self.frames["analysis"].export_results()
+    def _delegate(self, frame_name: str, method_name: str):
+        """
+        Call a method on a sub-frame, showing the frame first if needed
+        
+        Args:
+            frame_name (str): Name of the frame that handles the action
+            method_name (str): Name of the method to call on the frame
+        """
+        frame = self.frames.get(frame_name)
+        if self.current_frame == frame_name and hasattr(frame, method_name):
+            getattr(frame, method_name)()
         else:
-            self._show_frame("analysis")
-            self.root.after(500, self._export_results)
+            self._show_frame(frame_name)
+            self.root.after(500, self._delegate, frame_name, method_name)
     
     def _show_db_maintenance(self):
         """Show database maintenance dialog"""
@@ -712,36 +711,38 @@ class MainWindow:
         """Show the main window"""
         self.root.deiconify()
         
-        # Apply Windows-specific optimizations
+        # Apply Windows-specific optimizations off the UI thread
         if platform.system() == "Windows":
-            try:
-                # Set process priority
-                import psutil
-                import win32process
-                import win32api
-                
-                # Get the current process
-                process = psutil.Process()
-                
-                # Set process priority (normal or below normal based on config)
-                if self.config.get("system", "low_resource_mode", False):
-                    win32process.SetPriorityClass(
-                        win32api.GetCurrentProcess(),
-                        win32process.BELOW_NORMAL_PRIORITY_CLASS
-                    )
-                else:
-                    win32process.SetPriorityClass(
-                        win32api.GetCurrentProcess(),
-                        win32process.NORMAL_PRIORITY_CLASS
-                    )
-            except (ImportError, Exception) as e:
-                print(f"Could not set process priority: {e}")
+            threading.Thread(target=self._apply_process_priority, daemon=True).start()
         
         # Check for first run
         if self.config.get("system", "first_run", True):
             self._show_welcome_message()
             self.config.set("system", "first_run", False)
-            self.config.save()
+            
+            # Persist in the background so the UI thread doesn't wait on disk
+            threading.Thread(target=self.config.save, daemon=True).start()
+    
+    def _apply_process_priority(self):
+        """Set process priority class based on config (Windows only)"""
+        try:
+            # Imported lazily to keep pywin32 off the startup path
+            import win32process
+            import win32api
+            
+            # Set process priority (normal or below normal based on config)
+            if self.config.get("system", "low_resource_mode", False):
+                win32process.SetPriorityClass(
+                    win32api.GetCurrentProcess(),
+                    win32process.BELOW_NORMAL_PRIORITY_CLASS
+                )
+            else:
+                win32process.SetPriorityClass(
+                    win32api.GetCurrentProcess(),
+                    win32process.NORMAL_PRIORITY_CLASS
+                )
+        except (ImportError, Exception) as e:
+            print(f"Could not set process priority: {e}")
     
     def _show_welcome_message(self):
         """Show welcome message on first run"""
@@ -2,16 +2,95 @@
 Resource Monitor for tracking and managing system resource usage
 """
 
+import os
 import threading
 import time
 import logging
 import platform
 import psutil
+from collections import deque
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Callable
 
 # Local imports
 from src.utils.config import Config
 
+# The platform doesn't change while the app runs
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_LINUX = platform.system() == "Linux"
+
+
+@dataclass
+class ResourceSummary:
+    """Snapshot of application and system resource usage"""
+    
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "memory_current_mb", "memory_peak_mb", "memory_limit_mb", "memory_percent",
+        "system_memory_total_gb", "system_memory_available_gb", "system_memory_percent",
+        "cpu_process_percent", "cpu_system_percent", "cpu_limit_percent",
+        "cpu_cores", "cpu_logical_cores",
+        "disk_read_mb", "disk_write_mb", "disk_read_mb_per_sec", "disk_write_mb_per_sec",
+        "is_throttling", "is_idle", "is_on_battery"
+    )
+    
+    memory_current_mb: float
+    memory_peak_mb: float
+    memory_limit_mb: float
+    memory_percent: float
+    system_memory_total_gb: float
+    system_memory_available_gb: float
+    system_memory_percent: float
+    cpu_process_percent: float
+    cpu_system_percent: float
+    cpu_limit_percent: float
+    cpu_cores: Optional[int]
+    cpu_logical_cores: Optional[int]
+    disk_read_mb: float
+    disk_write_mb: float
+    disk_read_mb_per_sec: float
+    disk_write_mb_per_sec: float
+    is_throttling: bool
+    is_idle: bool
+    is_on_battery: bool
+    
+    def to_dict(self) -> Dict:
+        """
+        Convert the summary to the nested dictionary layout
+        
+        Returns:
+            dict: Resource usage summary grouped by memory, cpu, disk and status
+        """
+        return {
+            "memory": {
+                "current_mb": self.memory_current_mb,
+                "peak_mb": self.memory_peak_mb,
+                "limit_mb": self.memory_limit_mb,
+                "percent": self.memory_percent,
+                "system_total_gb": self.system_memory_total_gb,
+                "system_available_gb": self.system_memory_available_gb,
+                "system_percent": self.system_memory_percent
+            },
+            "cpu": {
+                "process_percent": self.cpu_process_percent,
+                "system_percent": self.cpu_system_percent,
+                "limit_percent": self.cpu_limit_percent,
+                "cores": self.cpu_cores,
+                "logical_cores": self.cpu_logical_cores
+            },
+            "disk": {
+                "read_mb": self.disk_read_mb,
+                "write_mb": self.disk_write_mb,
+                "read_mb_per_sec": self.disk_read_mb_per_sec,
+                "write_mb_per_sec": self.disk_write_mb_per_sec
+            },
+            "status": {
+                "is_throttling": self.is_throttling,
+                "is_idle": self.is_idle,
+                "is_on_battery": self.is_on_battery
+            }
+        }
+
 
 class ResourceMonitor:
     """Monitors system resources and manages application resource usage"""
@@ -30,36 +109,90 @@ class ResourceMonitor:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
-        # Resource limits from config
-        self.memory_limit_mb = config.get("system", "memory_limit_mb", 512)
-        self.cpu_limit_percent = config.get("system", "cpu_usage_limit", 50)
-        
-        # Critical thresholds (90% of limit)
-        self.memory_critical_mb = self.memory_limit_mb * 0.9
-        self.cpu_critical_percent = self.cpu_limit_percent * 0.9
+        # Resource limits and polling interval from config
+        self.refresh_config()
         
         # Throttling state
         self.is_throttling = False
         
+        # Minimum seconds between update_callback calls
+        self._min_ui_interval = 0.5
+        self._last_ui_ts = 0.0
+        
+        # Last reported threshold state per resource ("ok", "warning", "critical")
+        self._mem_state = "ok"
+        self._cpu_state = "ok"
+        
         # Peak memory usage tracking
         self.peak_memory_mb = 0
         
         # Process for monitoring
         self.process = psutil.Process()
         
+        # System totals never change during the process lifetime, so read them once
+        self._system_memory_total_bytes = psutil.virtual_memory().total
+        self._system_memory_total_mb = self._system_memory_total_bytes / (1024 * 1024)
+        self._physical_cores = psutil.cpu_count(logical=False)
+        self._logical_cores = psutil.cpu_count(logical=True)
+        
         # Thread for monitoring
         self.monitor_thread = None
         self.running = False
         
         # Throttling history for adaptive throttling
-        self.throttle_history = []
         self.max_history_size = 10
+        self.throttle_history = deque(maxlen=self.max_history_size)
+        self._throttle_count = 0  # Number of True entries in throttle_history
+        
+        # Most recent system-wide CPU usage sampled by the monitor loop
+        self._last_system_cpu = 0.0
+        
+        # Exponential moving average of system CPU, used for idle detection
+        self._cpu_ema = 0.0
+        
+        # Desktops have no battery, probe once so is_on_battery() can skip the query
+        try:
+            self._has_battery = psutil.sensors_battery() is not None
+        except Exception:
+            self._has_battery = False
+        
+        # Battery state cached by the monitor loop, refreshed every _battery_ttl_sec
+        # of wall time (ticks stretch on battery and when idle)
+        self._on_battery = self._query_battery()
+        self._battery_ts = time.monotonic()
+        self._battery_ttl_sec = 10.0
+        
+        # Fast RSS reader (falls back to psutil if unavailable). On Linux it
+        # keeps /proc/self/statm open in _statm_fd until stop().
+        self._statm_fd = None
+        self._statm_lock = threading.Lock()  # stop() and the monitor thread may both close it
+        self._rss_reader = self._init_rss_reader()
+        
+        # Disk IO baseline (counters, timestamp) for per-tick rates
+        try:
+            self._last_io = (self.process.io_counters(), time.monotonic())
+        except (psutil.Error, AttributeError):
+            self._last_io = None  # io_counters() not supported on this platform
+        self._io_rate = (0.0, 0.0)  # (read, write) in MB/s
+        self._io_total = self._io_totals_mb(self._last_io)  # (read, write) in MB
+        
+        # Latest sample published by the monitor loop for get_resource_summary().
+        # Replaced wholesale each tick, never mutated in place.
+        self._latest = None
+        
+        # Prime the CPU counters so non-blocking reads return a delta
+        self.process.cpu_percent(None)
+        psutil.cpu_percent(None)
     
     def start(self):
         """Start resource monitoring in a background thread"""
         if self.monitor_thread and self.monitor_thread.is_alive():
             return
             
+        # stop() closes the fast RSS reader, reopen it for this run
+        if self._rss_reader is None:
+            self._rss_reader = self._init_rss_reader()
+            
         self.running = True
         self.monitor_thread = threading.Thread(target=self._monitor_resources, daemon=True)
         self.monitor_thread.start()
@@ -70,46 +203,115 @@ class ResourceMonitor:
         self.running = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1.0)
+        
+        # Release the statm fd; if the thread is still finishing its tick,
+        # _read_rss() falls back to psutil
+        self._rss_reader = None
+        self._close_statm()
         self.logger.info("Resource monitor stopped")
     
+    def _lower_thread_priority(self):
+        """Run the calling (monitor) thread below normal priority"""
+        if _IS_WINDOWS:
+            try:
+                import pywintypes
+                import win32api
+                import win32process
+            except ImportError as e:
+                self.logger.debug(f"Could not lower monitor thread priority: {e}")
+                return
+            
+            try:
+                win32process.SetThreadPriority(
+                    win32api.GetCurrentThread(),
+                    win32process.THREAD_PRIORITY_BELOW_NORMAL
+                )
+            except pywintypes.error as e:
+                self.logger.debug(f"Could not lower monitor thread priority: {e}")
+                
+        elif _IS_LINUX:
+            try:
+                # On Linux nice() only applies to the calling thread
+                os.nice(10)
+            except OSError as e:
+                self.logger.debug(f"Could not lower monitor thread priority: {e}")
+    
     def _monitor_resources(self):
         """Background thread for monitoring system resources"""
+        # Observational thread, never compete with UI or scraper work
+        self._lower_thread_priority()
+        
+        # Deadline-based scheduling keeps a stable tick cadence
+        next_deadline = time.monotonic()
+        
         while self.running:
             try:
-                # Get memory usage
-                memory_info = self.process.memory_info()
-                memory_mb = memory_info.rss / (1024 * 1024)
+                now = time.monotonic()
+                
+                # Read per-process stats
+                rss_bytes = self._read_rss()
+                cpu_percent = self.process.cpu_percent(None)
+                memory_mb = rss_bytes / (1024 * 1024)
+                
+                # Sample system CPU (delta since the previous tick) and smooth it
+                self._last_system_cpu = psutil.cpu_percent(None)
+                if self._latest is None:
+                    self._cpu_ema = self._last_system_cpu
+                else:
+                    self._cpu_ema = 0.2 * self._last_system_cpu + 0.8 * self._cpu_ema
+                
+                # Disk IO rates since the previous tick
+                self._update_io_rate()
+                
+                # Battery state changes slowly, don't query it every tick
+                if now - self._battery_ts >= self._battery_ttl_sec:
+                    self._on_battery = self._query_battery()
+                    self._battery_ts = now
                 
                 # Update peak memory if needed
                 if memory_mb > self.peak_memory_mb:
                     self.peak_memory_mb = memory_mb
                 
                 # Calculate memory percentage relative to system memory
-                system_memory_mb = psutil.virtual_memory().total / (1024 * 1024)
-                memory_percent = (memory_mb / system_memory_mb) * 100
+                memory_percent = (memory_mb / self._system_memory_total_mb) * 100
                 
-                # Get CPU usage
-                cpu_percent = self.process.cpu_percent(interval=0.1)
+                # Build the sample fully, then publish it with a single reference
+                # swap so readers always see a complete snapshot without locking
+                snap = {
+                    "memory_mb": memory_mb,
+                    "cpu": cpu_percent,
+                    "system_cpu": self._last_system_cpu,
+                    "is_idle": self.is_system_idle(),
+                    "is_on_battery": self._on_battery,
+                    "io_rate": self._io_rate,
+                    "io_total": self._io_total
+                }
+                self._latest = snap
                 
                 # Check if we should be throttling
                 prev_throttling = self.is_throttling
                 self.is_throttling = memory_mb > self.memory_limit_mb or cpu_percent > self.cpu_limit_percent
                 
-                # Update throttling history
+                # Update throttling history (deque drops the oldest entry itself)
+                if len(self.throttle_history) == self.max_history_size:
+                    self._throttle_count -= self.throttle_history[0]
                 self.throttle_history.append(self.is_throttling)
-                if len(self.throttle_history) > self.max_history_size:
-                    self.throttle_history.pop(0)
+                self._throttle_count += self.is_throttling
                 
                 # Apply adaptive throttling if needed
-                if sum(self.throttle_history) >= self.max_history_size // 2:
+                if self._throttle_count >= self.max_history_size // 2:
                     # We've been throttling frequently, increase thresholds temporarily
                     self._adjust_thresholds(True)
-                elif not any(self.throttle_history):
+                elif self._throttle_count == 0:
                     # We haven't been throttling at all, reset thresholds
                     self._adjust_thresholds(False)
                 
-                # Call update callback
-                self.update_callback(memory_percent, memory_mb, cpu_percent, self.is_throttling)
+                # Call update callback, coalescing updates that arrive faster than
+                # the UI needs them (throttling changes are always delivered)
+                if (now - self._last_ui_ts >= self._min_ui_interval
+                        or prev_throttling != self.is_throttling):
+                    self._last_ui_ts = now
+                    self.update_callback(memory_percent, memory_mb, cpu_percent, self.is_throttling)
                 
                 # Check thresholds
                 self._check_thresholds(memory_mb, cpu_percent)
@@ -121,13 +323,158 @@ class ResourceMonitor:
                     else:
                         self.logger.info("Resource throttling deactivated")
                 
-                # Sleep between updates (configurable)
-                interval_sec = self.config.get("system", "resource_check_interval_sec", 2.0)
-                time.sleep(interval_sec)
+                # Sleep until the next tick (configurable), accounting for work time.
+                # Poll less often on battery power or when the system is idle.
+                interval_sec = self._interval_sec
+                if self._on_battery:
+                    interval_sec *= 4
+                if snap["is_idle"]:
+                    # Smoothed idle signal from is_system_idle(), so one quiet tick doesn't flip it
+                    interval_sec *= 2
+                next_deadline += interval_sec
+                sleep_for = next_deadline - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                else:
+                    # Fell behind (e.g. system resumed from sleep), don't burst
+                    next_deadline = time.monotonic()
+                
+            except psutil.NoSuchProcess as e:
+                # Process handle went stale, get a fresh one
+                self.logger.warning(f"Monitored process went away, reattaching: {e}")
+                self.process = psutil.Process()
+                self.process.cpu_percent(None)
+                time.sleep(min(5, self._interval_sec * 2))
+                next_deadline = time.monotonic()
                 
-            except Exception as e:
-                self.logger.error(f"Error monitoring resources: {e}")
+            except psutil.Error as e:
+                # Expected transient failures (access denied, timeouts)
+                self.logger.warning(f"Error reading resource usage: {e}")
+                time.sleep(min(5, self._interval_sec * 2))
+                next_deadline = time.monotonic()
+                
+            except Exception:
+                self.logger.exception("Unexpected error in resource monitor")
                 time.sleep(5)  # Wait longer before retrying if there was an error
+                next_deadline = time.monotonic()
+    
+    def _init_rss_reader(self) -> Optional[Callable]:
+        """
+        Set up a low-overhead reader for the current process RSS
+        
+        Returns:
+            callable: Function returning RSS in bytes, or None to use psutil
+        """
+        try:
+            if _IS_WINDOWS:
+                import ctypes
+                from ctypes import wintypes
+                
+                class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                    _fields_ = [
+                        ("cb", wintypes.DWORD),
+                        ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t),
+                        ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t),
+                        ("PeakPagefileUsage", ctypes.c_size_t),
+                    ]
+                
+                kernel32 = ctypes.WinDLL("kernel32")
+                kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+                psapi = ctypes.WinDLL("psapi")
+                psapi.GetProcessMemoryInfo.argtypes = [
+                    wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD
+                ]
+                psapi.GetProcessMemoryInfo.restype = wintypes.BOOL
+                
+                handle = kernel32.GetCurrentProcess()
+                counters = PROCESS_MEMORY_COUNTERS()
+                counters.cb = ctypes.sizeof(counters)
+                counters_ref = ctypes.byref(counters)
+                
+                def read_rss():
+                    if not psapi.GetProcessMemoryInfo(handle, counters_ref, counters.cb):
+                        raise OSError("GetProcessMemoryInfo failed")
+                    return counters.WorkingSetSize
+                
+            elif _IS_LINUX:
+                # Keep /proc/self/statm open and re-read it with pread()
+                fd = self._statm_fd = os.open("/proc/self/statm", os.O_RDONLY)
+                page_size = os.sysconf("SC_PAGE_SIZE")
+                
+                def read_rss():
+                    return int(os.pread(fd, 128, 0).split()[1]) * page_size
+                
+            else:
+                return None
+            
+            # Make sure the reader works before relying on it
+            read_rss()
+            return read_rss
+            
+        except Exception as e:
+            self.logger.debug(f"Fast RSS reader unavailable, using psutil: {e}")
+            self._close_statm()
+            return None
+    
+    def _close_statm(self):
+        """Close the /proc/self/statm descriptor used by the fast RSS reader, if open"""
+        with self._statm_lock:
+            fd, self._statm_fd = self._statm_fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def _read_rss(self) -> int:
+        """Get the current process RSS in bytes"""
+        if self._rss_reader is not None:
+            try:
+                return self._rss_reader()
+            except (OSError, ValueError, IndexError):
+                self._rss_reader = None
+                self._close_statm()
+        return self.process.memory_info().rss
+    
+    def _update_io_rate(self):
+        """Update per-second disk IO rates from the process IO counters"""
+        if self._last_io is None:
+            return
+            
+        prev_io, prev_time = self._last_io
+        now = time.monotonic()
+        io = self.process.io_counters()
+        
+        elapsed = now - prev_time
+        if elapsed > 0:
+            self._io_rate = (
+                (io.read_bytes - prev_io.read_bytes) / elapsed / (1024 * 1024),
+                (io.write_bytes - prev_io.write_bytes) / elapsed / (1024 * 1024)
+            )
+        
+        self._last_io = (io, now)
+        self._io_total = self._io_totals_mb(self._last_io)
+    
+    @staticmethod
+    def _io_totals_mb(last_io) -> tuple:
+        """
+        Get cumulative disk IO from a (counters, timestamp) pair
+        
+        Args:
+            last_io (tuple): IO counters and their timestamp, or None
+            
+        Returns:
+            tuple: (read, write) in MB
+        """
+        if last_io is None:
+            return (0.0, 0.0)
+        return (last_io[0].read_bytes / (1024 * 1024), last_io[0].write_bytes / (1024 * 1024))
     
     def _adjust_thresholds(self, increase: bool):
         """
@@ -145,42 +492,82 @@ class ResourceMonitor:
             
             self.memory_limit_mb = new_memory_limit
             self.cpu_limit_percent = new_cpu_limit
-            self.memory_critical_mb = self.memory_limit_mb * 0.9
-            self.cpu_critical_percent = self.cpu_limit_percent * 0.9
+            self._update_threshold_values()
         else:
             # Reset to config values
-            original_memory_limit = self.config.get("system", "memory_limit_mb", 512)
-            original_cpu_limit = self.config.get("system", "cpu_usage_limit", 50)
+            original_memory_limit = self._orig_memory_limit_mb
+            original_cpu_limit = self._orig_cpu_limit_percent
             
             if self.memory_limit_mb != original_memory_limit or self.cpu_limit_percent != original_cpu_limit:
                 self.logger.info(f"Resetting resource thresholds to original values")
                 
                 self.memory_limit_mb = original_memory_limit
                 self.cpu_limit_percent = original_cpu_limit
-                self.memory_critical_mb = self.memory_limit_mb * 0.9
-                self.cpu_critical_percent = self.cpu_limit_percent * 0.9
+                self._update_threshold_values()
+    
+    def refresh_config(self):
+        """Re-read monitor settings from config (call after settings are saved)"""
+        self._interval_sec = self.config.get("system", "resource_check_interval_sec", 2.0)
+        self._orig_memory_limit_mb = self.config.get("system", "memory_limit_mb", 512)
+        self._orig_cpu_limit_percent = self.config.get("system", "cpu_usage_limit", 50)
+        
+        self.memory_limit_mb = self._orig_memory_limit_mb
+        self.cpu_limit_percent = self._orig_cpu_limit_percent
+        
+        # Warning (70% of limit) and critical (90% of limit) thresholds
+        self._update_threshold_values()
+    
+    def _update_threshold_values(self):
+        """Recompute absolute warning and critical thresholds from the limits"""
+        self.memory_warning_mb = self.memory_limit_mb * 0.7
+        self.cpu_warning_percent = self.cpu_limit_percent * 0.7
+        self.memory_critical_mb = self.memory_limit_mb * 0.9
+        self.cpu_critical_percent = self.cpu_limit_percent * 0.9
     
     def _check_thresholds(self, memory_mb: float, cpu_percent: float):
         """
-        Check if resource thresholds are exceeded and call callback if needed
+        Check if resource thresholds are exceeded and call callback on state changes
         
         Args:
             memory_mb (float): Current memory usage in MB
             cpu_percent (float): Current CPU usage percent
         """
-        # Check memory critical threshold
+        # Common case: both metrics are below warning, just record recovery
+        if memory_mb <= self.memory_warning_mb and cpu_percent <= self.cpu_warning_percent:
+            self._mem_state = "ok"
+            self._cpu_state = "ok"
+            return
+        
+        # Check memory thresholds
         if memory_mb > self.memory_critical_mb:
-            self.threshold_callback("memory", memory_mb, self.memory_critical_mb, True)
-        # Check memory warning threshold
-        elif memory_mb > self.memory_limit_mb * 0.7:
-            self.threshold_callback("memory", memory_mb, self.memory_limit_mb * 0.7, False)
+            mem_state = "critical"
+        elif memory_mb > self.memory_warning_mb:
+            mem_state = "warning"
+        else:
+            mem_state = "ok"
             
-        # Check CPU critical threshold
+        # Check CPU thresholds
         if cpu_percent > self.cpu_critical_percent:
-            self.threshold_callback("cpu", cpu_percent, self.cpu_critical_percent, True)
-        # Check CPU warning threshold
-        elif cpu_percent > self.cpu_limit_percent * 0.7:
-            self.threshold_callback("cpu", cpu_percent, self.cpu_limit_percent * 0.7, False)
+            cpu_state = "critical"
+        elif cpu_percent > self.cpu_warning_percent:
+            cpu_state = "warning"
+        else:
+            cpu_state = "ok"
+        
+        # Only notify when a resource enters a new elevated state
+        if mem_state != self._mem_state:
+            self._mem_state = mem_state
+            if mem_state == "critical":
+                self.threshold_callback("memory", memory_mb, self.memory_critical_mb, True)
+            elif mem_state == "warning":
+                self.threshold_callback("memory", memory_mb, self.memory_warning_mb, False)
+                
+        if cpu_state != self._cpu_state:
+            self._cpu_state = cpu_state
+            if cpu_state == "critical":
+                self.threshold_callback("cpu", cpu_percent, self.cpu_critical_percent, True)
+            elif cpu_state == "warning":
+                self.threshold_callback("cpu", cpu_percent, self.cpu_warning_percent, False)
     
     def get_peak_memory(self) -> float:
         """Get peak memory usage in MB"""
@@ -199,11 +586,11 @@ class ResourceMonitor:
         """
         cpu_idle_threshold = 15  # % CPU usage
         
-        # Check CPU usage
-        cpu_usage = psutil.cpu_percent(interval=0.5)
+        # Use the smoothed CPU usage maintained by the monitor loop
+        cpu_usage = self._cpu_ema
         
         # On Windows, also check user idle time
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             try:
                 import win32api
                 
@@ -229,65 +616,82 @@ class ResourceMonitor:
         Returns:
             bool: True if on battery
         """
+        # The monitor loop refreshes the state every few ticks, only query
+        # directly when it isn't running
+        if self.running:
+            return self._on_battery
+        return self._query_battery()
+    
+    def _query_battery(self) -> bool:
+        """Ask the OS whether the system is running on battery power"""
+        if not self._has_battery:
+            return False
+        
         try:
             battery = psutil.sensors_battery()
             return battery is not None and not battery.power_plugged
         except (AttributeError, psutil.Error):
             return False
     
-    def get_resource_summary(self) -> Dict:
+    def get_resource_summary(self) -> ResourceSummary:
         """
         Get detailed resource usage summary
         
         Returns:
-            dict: Resource usage summary
+            ResourceSummary: Resource usage summary
         """
-        # Current process info
-        process = self.process
+        # Use the latest sample from the monitor loop when available
+        latest = self._latest
         
-        # Memory info
-        memory_info = process.memory_info()
-        memory_mb = memory_info.rss / (1024 * 1024)
+        if latest is not None:
+            memory_mb = latest["memory_mb"]
+            cpu_percent = latest["cpu"]
+            system_cpu_percent = latest["system_cpu"]
+            is_idle = latest["is_idle"]
+            is_on_battery = latest["is_on_battery"]
+            read_mb, write_mb = latest["io_total"]
+            read_rate, write_rate = latest["io_rate"]
+        else:
+            # Monitor hasn't ticked yet. Don't call cpu_percent() here, that would
+            # reset the sampling window the monitor thread relies on.
+            memory_mb = self.process.memory_info().rss / (1024 * 1024)
+            cpu_percent = 0.0
+            system_cpu_percent = self._last_system_cpu
+            is_idle = self.is_system_idle()
+            is_on_battery = self.is_on_battery()
+            read_mb, write_mb = self._io_total
+            read_rate, write_rate = 0.0, 0.0
         
-        # System memory info
+        # System memory info (non-blocking)
         system_memory = psutil.virtual_memory()
         
-        # CPU info
-        cpu_percent = process.cpu_percent(interval=0.1)
-        system_cpu_percent = psutil.cpu_percent(interval=0.1)
-        
-        # Disk IO
-        try:
-            disk_io = process.io_counters()
-            read_mb = disk_io.read_bytes / (1024 * 1024)
-            write_mb = disk_io.write_bytes / (1024 * 1024)
-        except (psutil.Error, AttributeError):
-            read_mb = write_mb = 0
+        return ResourceSummary(
+            memory_current_mb=memory_mb,
+            memory_peak_mb=self.peak_memory_mb,
+            memory_limit_mb=self.memory_limit_mb,
+            memory_percent=(memory_mb / self._system_memory_total_mb) * 100,
+            system_memory_total_gb=self._system_memory_total_bytes / (1024 ** 3),
+            system_memory_available_gb=system_memory.available / (1024 ** 3),
+            system_memory_percent=system_memory.percent,
+            cpu_process_percent=cpu_percent,
+            cpu_system_percent=system_cpu_percent,
+            cpu_limit_percent=self.cpu_limit_percent,
+            cpu_cores=self._physical_cores,
+            cpu_logical_cores=self._logical_cores,
+            disk_read_mb=read_mb,
+            disk_write_mb=write_mb,
+            disk_read_mb_per_sec=read_rate,
+            disk_write_mb_per_sec=write_rate,
+            is_throttling=self.is_throttling,
+            is_idle=is_idle,
+            is_on_battery=is_on_battery
+        )
+    
+    def get_resource_summary_dict(self) -> Dict:
+        """
+        Get detailed resource usage summary as a nested dictionary
         
-        return {
-            "memory": {
-                "current_mb": memory_mb,
-                "peak_mb": self.peak_memory_mb,
-                "limit_mb": self.memory_limit_mb,
-                "percent": (memory_mb / (system_memory.total / (1024 * 1024))) * 100,
-                "system_total_gb": system_memory.total / (1024 ** 3),
-                "system_available_gb": system_memory.available / (1024 ** 3),
-                "system_percent": system_memory.percent
-            },
-            "cpu": {
-                "process_percent": cpu_percent,
-                "system_percent": system_cpu_percent,
-                "limit_percent": self.cpu_limit_percent,
-                "cores": psutil.cpu_count(logical=False),
-                "logical_cores": psutil.cpu_count(logical=True)
-            },
-            "disk": {
-                "read_mb": read_mb,
-                "write_mb": write_mb
-            },
-            "status": {
-                "is_throttling": self.is_throttling,
-                "is_idle": self.is_system_idle(),
-                "is_on_battery": self.is_on_battery()
-            }
-        }
\ No newline at end of file
+        Returns:
+            dict: Resource usage summary
+        """
+        return self.get_resource_summary().to_dict()
@@ -5,30 +5,150 @@ Scraper frame for controlling and monitoring FB Marketplace scraping
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import time
 import json
+import sqlite3
+from contextlib import closing
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 # Local imports
-from src.utils.config import Config
+from src.utils.config import Config, CachedConfig
 from src.database.db_manager import DatabaseManager
-from src.scraper.fb_marketplace_scraper import ResourceEfficientScraper
+from src.scraper.fb_marketplace_scraper import ResourceEfficientScraper, ScraperStats
 from src.scraper.scheduler import TaskScheduler
 
+# Use orjson for saved search params when available (optional dependency)
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+    
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+def _fmt_iso(s, want_time=True):
+    """
+    Format an ISO 8601 timestamp for display by slicing, without parsing it
+    
+    Args:
+        s (str): ISO 8601 timestamp
+        want_time (bool): Include hours and minutes
+        
+    Returns:
+        str: "YYYY-MM-DD HH:MM", "YYYY-MM-DD", or str(s) if s isn't a timestamp
+    """
+    if isinstance(s, str) and len(s) >= 10:
+        return s[:16].replace("T", " ") if want_time else s[:10]
+    return str(s)
+
+# Saved search queries
+_SQL_LIST_SEARCHES = """
+SELECT id, name, search_params, last_run, auto_run FROM saved_searches
+ORDER BY name
+"""
+# Recent listings shown in the results tree
+_SQL_RECENT_LISTINGS = """
+SELECT id, title, price, year, make, model, mileage, location, listing_date
+FROM car_listings
+ORDER BY listing_date DESC
+LIMIT 100
+"""
+
+_SQL_LIST_SEARCHES_DISPLAY = """
+SELECT id, name,
+       json_extract(search_params, '$.url') AS url,
+       substr(replace(last_run, 'T', ' '), 1, 16) AS last_run_str,
+       CASE WHEN auto_run THEN 'Yes' ELSE 'No' END AS auto_run_str
+FROM saved_searches
+WHERE json_valid(search_params)
+ORDER BY name
+"""
+_SQL_GET_SEARCH_PARAMS = "SELECT search_params FROM saved_searches WHERE id = ?"
+_SQL_FIND_SEARCH_BY_NAME = "SELECT id FROM saved_searches WHERE name = ?"
+_SQL_UPDATE_SEARCH = """
+UPDATE saved_searches 
+SET search_params = ?, last_run = NULL
+WHERE id = ?
+"""
+_SQL_INSERT_SEARCH = """
+INSERT INTO saved_searches (name, search_params, created_date)
+VALUES (?, ?, ?)
+"""
+_SQL_DELETE_SEARCH = "DELETE FROM saved_searches WHERE id = ?"
+_SQL_SET_AUTO_RUN = "UPDATE saved_searches SET auto_run = ? WHERE id = ?"
+
 
 class ScraperFrame(ttk.Frame):
     """Frame for controlling and monitoring Facebook Marketplace scraping"""
     
+    # Scraping engine, constructed as scraper_class(config, db_manager) per run
+    scraper_class = ResourceEfficientScraper
+    
+    # Treeview columns as (column id, heading, width, anchor)
+    _RESULTS_COLS = (
+        ("title", "Title", 200, "w"),
+        ("price", "Price", 80, "e"),
+        ("year", "Year", 60, "center"),
+        ("make", "Make", 100, "w"),
+        ("model", "Model", 100, "w"),
+        ("mileage", "Mileage", 80, "e"),
+        ("location", "Location", 120, "w"),
+        ("date", "Date", 100, "center"),
+    )
+    _SEARCHES_COLS = (
+        ("name", "Name", 150, "w"),
+        ("url", "URL", 250, "w"),
+        ("last_run", "Last Run", 100, "w"),
+        ("auto_run", "Auto Run", 80, "center"),
+    )
+    
+    # Config-backed controls as (section, option, control variable, cast)
+    _CONFIG_BINDINGS = (
+        ("scraper", "max_listings", "max_listings_var", int),
+        ("scraper", "batch_size", "batch_size_var", int),
+        ("scraper", "headless", "headless_var", bool),
+        ("scraper", "disable_images", "disable_images_var", bool),
+        ("system", "low_resource_mode", "low_resource_var", bool),
+    )
+    
+    # Saved search parameter -> (control variable, default, cast)
+    _PARAM_BINDINGS = (
+        ("max_listings", "max_listings_var", 500, str),
+        ("batch_size", "batch_size_var", 50, str),
+        ("headless", "headless_var", True, bool),
+        ("disable_images", "disable_images_var", True, bool),
+    )
+    
     def __init__(self, parent, config: Config, db_manager: DatabaseManager,
                 scheduler: TaskScheduler):
         """Initialize the scraper frame"""
         super().__init__(parent)
         self.parent = parent
-        self.config = config
+        self.config = CachedConfig(config)  # Option reads are served from memory
         self.db_manager = db_manager
         self.scheduler = scheduler
         
+        # Connection (owned by db_manager) and SQL for listing URL lookups
+        self._conn = self.db_manager.connect()
+        self._url_stmt_sql = "SELECT url FROM car_listings WHERE id = ?"
+        
+        # Snapshot of the config sections read while building widgets
+        self._snapshot_config()
+        
+        # Changed config-backed controls, keyed by (section, option)
+        self._config_dirty = {}
+        
+        # Debounced config save, see _schedule_save()
+        self._config_save_pending = False
+        self._config_save_after_id = None
+        
         # Configure grid layout
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
@@ -39,13 +159,37 @@ class ScraperFrame(ttk.Frame):
         
         # Scraper state
         self.scraper = None
-        self.scraper_thread = None
+        self.scraper_future = None
+        
+        # Scraping runs execute one at a time on a dedicated worker, so only
+        # one browser driver is ever alive for this frame
+        self._scrape_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper")
         self.is_scraping = False
-        self.log_queue = []
+        self._stats_cache = {}  # Last values shown in the monitor panel
         self.max_log_entries = 100
         
-        # Saved searches
+        # Pending log lines, filled from any thread and drained by a Tk-thread poller
+        self._log_q = queue.Queue()
+        self._log_poll_ms = 100
+        self._drain_after_id = None
+        
+        # Dialogs are built on first use and reused afterwards
+        self._searches_dialog = None
+        self._searches_tree = None
+        self._scheduler_dialog = None
+        
+        # Saved searches, plus a URL -> (name, params) lookup
         self.saved_searches = []
+        self._searches_by_url = {}
+        
+        # Formatted result rows not yet inserted into the results tree
+        self._pending_results = []
+        self._results_page_size = 50
+        self._results_generation = 0
+        
+        # URLs currently shown in the URL combobox
+        self._url_list = []
+        self._url_set = set()
         
         # Create UI elements
         self._create_header()
@@ -55,6 +199,17 @@ class ScraperFrame(ttk.Frame):
         
         # Load saved searches
         self._load_saved_searches()
+        
+        # Start moving queued log lines into the log widget
+        self._drain_after_id = self.after(self._log_poll_ms, self._drain_logs)
+    
+    def _snapshot_config(self):
+        """Copy the config sections used by this frame into plain dicts"""
+        all_config = self.config.get_all()
+        self._cfg = {
+            section: dict(all_config.get(section, {}))
+            for section in ("scraper", "system", "scheduler")
+        }
     
     def _create_header(self):
         """Create the scraper header"""
@@ -113,32 +268,32 @@ class ScraperFrame(ttk.Frame):
         
         # Max listings
         ttk.Label(options_frame, text="Max Listings:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        self.max_listings_var = tk.StringVar(value=str(self.config.get("scraper", "max_listings", 500)))
+        self.max_listings_var = tk.StringVar(value=str(self._cfg["scraper"].get("max_listings", 500)))
         max_spinbox = ttk.Spinbox(options_frame, from_=10, to=2000, increment=10, 
                                  textvariable=self.max_listings_var, width=5)
         max_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=2)
         
         # Batch size
         ttk.Label(options_frame, text="Batch Size:").grid(row=0, column=2, sticky="w", padx=5, pady=2)
-        self.batch_size_var = tk.StringVar(value=str(self.config.get("scraper", "batch_size", 50)))
+        self.batch_size_var = tk.StringVar(value=str(self._cfg["scraper"].get("batch_size", 50)))
         batch_spinbox = ttk.Spinbox(options_frame, from_=10, to=200, increment=10, 
                                   textvariable=self.batch_size_var, width=5)
         batch_spinbox.grid(row=0, column=3, sticky="w", padx=5, pady=2)
         
         # Headless mode
-        self.headless_var = tk.BooleanVar(value=self.config.get("scraper", "headless", True))
+        self.headless_var = tk.BooleanVar(value=self._cfg["scraper"].get("headless", True))
         headless_check = ttk.Checkbutton(options_frame, text="Headless Mode", 
                                        variable=self.headless_var)
         headless_check.grid(row=0, column=4, sticky="w", padx=5, pady=2)
         
         # Disable images
-        self.disable_images_var = tk.BooleanVar(value=self.config.get("scraper", "disable_images", True))
+        self.disable_images_var = tk.BooleanVar(value=self._cfg["scraper"].get("disable_images", True))
         images_check = ttk.Checkbutton(options_frame, text="Disable Images", 
                                      variable=self.disable_images_var)
         images_check.grid(row=0, column=5, sticky="w", padx=5, pady=2)
         
         # Low resource mode
-        self.low_resource_var = tk.BooleanVar(value=self.config.get("system", "low_resource_mode", False))
+        self.low_resource_var = tk.BooleanVar(value=self._cfg["system"].get("low_resource_mode", False))
         low_resource_check = ttk.Checkbutton(options_frame, text="Low Resource Mode", 
                                            variable=self.low_resource_var)
         low_resource_check.grid(row=0, column=6, sticky="w", padx=5, pady=2)
@@ -177,6 +332,9 @@ class ScraperFrame(ttk.Frame):
         self.apply_btn = ttk.Button(buttons_frame, text="Apply Settings", 
                                   command=self._apply_settings)
         self.apply_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Collect setting changes until they are applied
+        self._track_config_changes()
     
     def _create_log_monitor(self):
         """Create scraper log and monitoring area"""
@@ -194,11 +352,17 @@ class ScraperFrame(ttk.Frame):
         self.log_text = tk.Text(log_frame, height=15, width=60, 
                               font=("Consolas", 9),
                               yscrollcommand=log_scroll.set,
-                              state=tk.DISABLED)
+                              state=tk.DISABLED,
+                              undo=False, autoseparators=False, maxundo=0)
         self.log_text.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         
         log_scroll.config(command=self.log_text.yview)
         
+        # Add tags for coloring
+        self.log_text.tag_configure("info", foreground="black")
+        self.log_text.tag_configure("error", foreground="red")
+        self.log_text.tag_configure("warning", foreground="orange")
+        
         # Create monitoring area
         monitor_frame = ttk.LabelFrame(self, text="Resource Monitor")
         monitor_frame.grid(row=2, column=1, sticky="nsew", padx=10, pady=5)
@@ -294,39 +458,22 @@ class ScraperFrame(ttk.Frame):
         results_frame.grid_rowconfigure(0, weight=1)
         
         # Create treeview with scrollbars
-        tree_scroll_y = ttk.Scrollbar(results_frame)
-        tree_scroll_y.grid(row=0, column=1, sticky="ns")
+        self.results_scroll_y = ttk.Scrollbar(results_frame)
+        self.results_scroll_y.grid(row=0, column=1, sticky="ns")
         
         tree_scroll_x = ttk.Scrollbar(results_frame, orient="horizontal")
         tree_scroll_x.grid(row=1, column=0, sticky="ew")
         
-        self.results_tree = ttk.Treeview(results_frame, columns=(
-            "title", "price", "year", "make", "model", "mileage", "location", "date"
-        ), show="headings", yscrollcommand=tree_scroll_y.set, xscrollcommand=tree_scroll_x.set)
-        
-        # Configure column headings
-        self.results_tree.heading("title", text="Title")
-        self.results_tree.heading("price", text="Price")
-        self.results_tree.heading("year", text="Year")
-        self.results_tree.heading("make", text="Make")
-        self.results_tree.heading("model", text="Model")
-        self.results_tree.heading("mileage", text="Mileage")
-        self.results_tree.heading("location", text="Location")
-        self.results_tree.heading("date", text="Date")
-        
-        # Configure column widths
-        self.results_tree.column("title", width=200)
-        self.results_tree.column("price", width=80, anchor="e")
-        self.results_tree.column("year", width=60, anchor="center")
-        self.results_tree.column("make", width=100)
-        self.results_tree.column("model", width=100)
-        self.results_tree.column("mileage", width=80, anchor="e")
-        self.results_tree.column("location", width=120)
-        self.results_tree.column("date", width=100, anchor="center")
+        self.results_tree = ttk.Treeview(results_frame, columns=tuple(c[0] for c in self._RESULTS_COLS),
+                                         show="headings", yscrollcommand=self._on_results_scroll,
+                                         xscrollcommand=tree_scroll_x.set)
+        
+        # Configure column headings and widths
+        self._configure_tree_columns(self.results_tree, self._RESULTS_COLS)
         
         self.results_tree.grid(row=0, column=0, sticky="nsew")
         
-        tree_scroll_y.config(command=self.results_tree.yview)
+        self.results_scroll_y.config(command=self.results_tree.yview)
         tree_scroll_x.config(command=self.results_tree.xview)
         
         # Add right-click menu for listings
@@ -354,28 +501,36 @@ class ScraperFrame(ttk.Frame):
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-            SELECT id, name, search_params FROM saved_searches
-            ORDER BY name
-            """)
+            cursor.execute(_SQL_LIST_SEARCHES)
             
-            self.saved_searches = cursor.fetchall()
+            # Parse search parameters once, as (id, name, params, last_run, auto_run)
+            self.saved_searches = []
+            self._searches_by_url = {}
+            for search_id, name, params, last_run, auto_run in cursor.fetchall():
+                try:
+                    search_params = _loads(params)
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                self.saved_searches.append((search_id, name, search_params, last_run, auto_run))
+                
+                # First search (by name) wins when several share a URL
+                self._searches_by_url.setdefault(search_params.get("url"), (name, search_params))
             
             # Populate URL combobox
-            urls = []
-            for _, name, params in self.saved_searches:
-                try:
-                    search_params = json.loads(params)
-                    urls.append(search_params.get("url", ""))
-                except (json.JSONDecodeError, KeyError):
-                    pass
+            urls = [search_params.get("url", "") for _, _, search_params, _, _ in self.saved_searches]
+            url_set = set(urls)
             
             # Add default URL if not already in list
             default_url = "https://www.facebook.com/marketplace/category/vehicles"
-            if default_url not in urls:
+            if default_url not in url_set:
                 urls.append(default_url)
-                
-            self.url_combo["values"] = urls
+                url_set.add(default_url)
+            
+            # Only reconfigure the combobox when the URLs actually changed
+            if urls != self._url_list:
+                self._url_list = urls
+                self._url_set = url_set
+                self.url_combo["values"] = tuple(urls)
             
         except Exception as e:
             self._log(f"Error loading saved searches: {e}", "error")
@@ -403,35 +558,27 @@ class ScraperFrame(ttk.Frame):
             "disable_images": self.disable_images_var.get()
         }
         
-        # Save to database
+        # Save to database (one transaction for the lookup and the write)
         conn = self.db_manager.connect()
-        cursor = conn.cursor()
         
         try:
-            # Check if name already exists
-            cursor.execute("SELECT id FROM saved_searches WHERE name = ?", (name,))
-            existing = cursor.fetchone()
+            with conn:
+                # Check if name already exists
+                existing = conn.execute(_SQL_FIND_SEARCH_BY_NAME, (name,)).fetchone()
+                
+                if existing:
+                    # Update existing
+                    conn.execute(_SQL_UPDATE_SEARCH, (_dumps(search_params), existing[0]))
+                else:
+                    # Insert new
+                    conn.execute(_SQL_INSERT_SEARCH,
+                                 (name, _dumps(search_params), datetime.now().isoformat()))
             
             if existing:
-                # Update existing
-                cursor.execute("""
-                UPDATE saved_searches 
-                SET search_params = ?, last_run = NULL
-                WHERE id = ?
-                """, (json.dumps(search_params), existing[0]))
-                
                 self._log(f"Updated saved search: {name}")
             else:
-                # Insert new
-                cursor.execute("""
-                INSERT INTO saved_searches (name, search_params, created_date)
-                VALUES (?, ?, ?)
-                """, (name, json.dumps(search_params), datetime.now().isoformat()))
-                
                 self._log(f"Created new saved search: {name}")
             
-            conn.commit()
-            
             # Reload saved searches
             self._load_saved_searches()
             
@@ -443,32 +590,48 @@ class ScraperFrame(ttk.Frame):
         url = self.url_var.get()
         
         # Find the matching saved search
-        for _, name, params in self.saved_searches:
-            try:
-                search_params = json.loads(params)
-                if search_params.get("url") == url:
-                    # Load the parameters
-                    self.max_listings_var.set(str(search_params.get("max_listings", 500)))
-                    self.batch_size_var.set(str(search_params.get("batch_size", 50)))
-                    self.headless_var.set(search_params.get("headless", True))
-                    self.disable_images_var.set(search_params.get("disable_images", True))
-                    
-                    self._log(f"Loaded saved search: {name}")
-                    return
-            except (json.JSONDecodeError, KeyError):
-                pass
+        match = self._searches_by_url.get(url)
+        if match:
+            name, search_params = match
+            
+            # Load the parameters
+            self._apply_search_params(search_params)
+            
+            self._log(f"Loaded saved search: {name}")
+    
+    def _apply_search_params(self, search_params):
+        """
+        Set the scraper option controls from saved search parameters
+        
+        Args:
+            search_params (dict): Saved search parameters
+        """
+        for key, var_name, default, cast in self._PARAM_BINDINGS:
+            getattr(self, var_name).set(cast(search_params.get(key, default)))
     
     def show_saved_searches(self):
         """Show dialog with all saved searches"""
+        # Build the dialog once, later opens only refresh its rows
+        if self._searches_dialog is None or not self._searches_dialog.winfo_exists():
+            self._build_searches_dialog()
+        else:
+            self._searches_dialog.deiconify()
+            self._searches_dialog.lift()
+            
+        self._populate_searches_tree()
+        
+        # Make dialog modal
+        self._searches_dialog.grab_set()
+        self._searches_dialog.focus_set()
+    
+    def _build_searches_dialog(self):
+        """Create the saved searches dialog widgets"""
         # Create a new toplevel window
         dialog = tk.Toplevel(self)
         dialog.title("Saved Searches")
         dialog.geometry("600x400")
         dialog.transient(self)
-        dialog.grab_set()
-        
-        # Make dialog modal
-        dialog.focus_set()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
         
         # Configure dialog layout
         dialog.grid_columnconfigure(0, weight=1)
@@ -493,168 +656,174 @@ class ScraperFrame(ttk.Frame):
         tree_scroll = ttk.Scrollbar(tree_frame)
         tree_scroll.grid(row=0, column=1, sticky="ns")
         
-        searches_tree = ttk.Treeview(tree_frame, columns=(
-            "name", "url", "last_run", "auto_run"
-        ), show="headings", yscrollcommand=tree_scroll.set)
+        searches_tree = ttk.Treeview(tree_frame, columns=tuple(c[0] for c in self._SEARCHES_COLS),
+                                     show="headings", yscrollcommand=tree_scroll.set)
         
-        searches_tree.heading("name", text="Name")
-        searches_tree.heading("url", text="URL")
-        searches_tree.heading("last_run", text="Last Run")
-        searches_tree.heading("auto_run", text="Auto Run")
-        
-        searches_tree.column("name", width=150)
-        searches_tree.column("url", width=250)
-        searches_tree.column("last_run", width=100)
-        searches_tree.column("auto_run", width=80, anchor="center")
+        self._configure_tree_columns(searches_tree, self._SEARCHES_COLS)
         
         searches_tree.grid(row=0, column=0, sticky="nsew")
         tree_scroll.config(command=searches_tree.yview)
         
-        # Populate treeview
+        # Create buttons
+        buttons_frame = ttk.Frame(dialog)
+        buttons_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
+        
+        ttk.Button(buttons_frame, text="Load", command=self._load_search_from_dialog).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Delete", command=self._delete_search_from_dialog).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Toggle Auto Run", command=self._toggle_search_auto_run).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Close", command=lambda: self._hide_dialog(dialog)).pack(side=tk.RIGHT, padx=5)
+        
+        self._searches_dialog = dialog
+        self._searches_tree = searches_tree
+    
+    def _hide_dialog(self, dialog):
+        """
+        Hide a cached dialog so it can be reopened without rebuilding it
+        
+        Args:
+            dialog (tk.Toplevel): Dialog to hide
+        """
+        dialog.grab_release()
+        dialog.withdraw()
+    
+    def _populate_searches_tree(self):
+        """Reload the saved searches dialog rows from the database"""
+        searches_tree = self._searches_tree
+        children = searches_tree.get_children()
+        if children:
+            searches_tree.delete(*children)
+        
         conn = self.db_manager.connect()
-        cursor = conn.cursor()
         
+        # Populate treeview, letting SQLite extract the URL and format the columns
         try:
-            cursor.execute("""
-            SELECT id, name, search_params, last_run, auto_run
-            FROM saved_searches
-            ORDER BY name
-            """)
-            
-            for row in cursor.fetchall():
-                search_id, name, params, last_run, auto_run = row
-                
-                try:
-                    search_params = json.loads(params)
-                    url = search_params.get("url", "")
-                    
-                    # Format last run
-                    if last_run:
-                        try:
-                            last_dt = datetime.fromisoformat(last_run)
-                            last_run_str = last_dt.strftime("%Y-%m-%d %H:%M")
-                        except ValueError:
-                            last_run_str = last_run
-                    else:
-                        last_run_str = "Never"
-                        
-                    auto_run_str = "Yes" if auto_run else "No"
-                    
-                    searches_tree.insert("", "end", text=str(search_id), values=(
-                        name, url, last_run_str, auto_run_str
-                    ))
-                    
-                except (json.JSONDecodeError, KeyError):
-                    pass
-                    
+            rows = [
+                (str(search_id), (name, url or "", last_run_str or "Never", auto_run_str))
+                for search_id, name, url, last_run_str, auto_run_str
+                in conn.execute(_SQL_LIST_SEARCHES_DISPLAY)
+            ]
         except Exception as e:
+            rows = []
             messagebox.showerror("Error", f"Error loading saved searches: {e}")
         
-        # Create buttons
-        buttons_frame = ttk.Frame(dialog)
-        buttons_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
-        
-        # Function to load selected search
-        def load_selected():
-            selection = searches_tree.selection()
-            if not selection:
-                return
-                
-            item = searches_tree.item(selection[0])
-            search_id = item["text"]
+        self._bulk_insert(searches_tree, rows)
+    
+    def _load_search_from_dialog(self):
+        """Load the search selected in the saved searches dialog"""
+        searches_tree = self._searches_tree
+        selection = searches_tree.selection()
+        if not selection:
+            return
             
-            # Find matching search
-            cursor.execute("SELECT search_params FROM saved_searches WHERE id = ?", (search_id,))
-            result = cursor.fetchone()
+        item = searches_tree.item(selection[0])
+        search_id = item["text"]
+        
+        # Find matching search with a short-lived cursor, so the read statement
+        # is finalized right away instead of holding a WAL snapshot open
+        with closing(self.db_manager.connect().cursor()) as cursor:
+            result = cursor.execute(_SQL_GET_SEARCH_PARAMS, (search_id,)).fetchone()
+        try:
+            search_params = _loads(result[0]) if result else None
+        except (json.JSONDecodeError, TypeError):
+            search_params = None
+        
+        if search_params is not None:
+            url = search_params.get("url", "")
             
-            if result:
-                try:
-                    search_params = json.loads(result[0])
-                    url = search_params.get("url", "")
-                    
-                    # Set URL and parameters
-                    self.url_var.set(url)
-                    self.max_listings_var.set(str(search_params.get("max_listings", 500)))
-                    self.batch_size_var.set(str(search_params.get("batch_size", 50)))
-                    self.headless_var.set(search_params.get("headless", True))
-                    self.disable_images_var.set(search_params.get("disable_images", True)))
-                    
-                    dialog.destroy()
-                    
-                except (json.JSONDecodeError, KeyError):
-                    messagebox.showerror("Error", "Invalid search parameters.")
-        
-        # Function to delete selected search
-        def delete_selected():
-            selection = searches_tree.selection()
-            if not selection:
-                return
-                
-            item = searches_tree.item(selection[0])
-            search_id = item["text"]
-            name = item["values"][0]
+            # Set URL and parameters
+            self.url_var.set(url)
+            self._apply_search_params(search_params)
             
-            if messagebox.askyesno("Confirm Delete", f"Delete saved search '{name}'?"):
-                try:
-                    cursor.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,))
-                    conn.commit()
-                    
-                    # Remove from treeview
-                    searches_tree.delete(selection[0])
-                    
-                    # Reload saved searches
-                    self._load_saved_searches()
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error deleting search: {e}")
-        
-        # Function to toggle auto run
-        def toggle_auto_run():
-            selection = searches_tree.selection()
-            if not selection:
-                return
-                
-            item = searches_tree.item(selection[0])
-            search_id = item["text"]
-            auto_run = item["values"][3] == "Yes"
+            self._hide_dialog(self._searches_dialog)
+        else:
+            messagebox.showerror("Error", "Invalid search parameters.")
+    
+    def _delete_search_from_dialog(self):
+        """Delete the search selected in the saved searches dialog"""
+        searches_tree = self._searches_tree
+        selection = searches_tree.selection()
+        if not selection:
+            return
             
+        item = searches_tree.item(selection[0])
+        search_id = item["text"]
+        name = item["values"][0]
+        
+        if messagebox.askyesno("Confirm Delete", f"Delete saved search '{name}'?"):
             try:
-                cursor.execute("""
-                UPDATE saved_searches SET auto_run = ? WHERE id = ?
-                """, (not auto_run, search_id))
-                conn.commit()
+                conn = self.db_manager.connect()
+                with conn:
+                    conn.execute(_SQL_DELETE_SEARCH, (search_id,))
                 
-                # Update treeview
-                searches_tree.item(selection[0], values=(
-                    item["values"][0],
-                    item["values"][1],
-                    item["values"][2],
-                    "No" if auto_run else "Yes"
-                ))
+                # Remove from treeview
+                searches_tree.delete(selection[0])
                 
                 # Reload saved searches
                 self._load_saved_searches()
                 
             except Exception as e:
-                messagebox.showerror("Error", f"Error updating search: {e}")
+                messagebox.showerror("Error", f"Error deleting search: {e}")
+    
+    def _toggle_search_auto_run(self):
+        """Toggle auto run for the searches selected in the saved searches dialog"""
+        searches_tree = self._searches_tree
+        selection = searches_tree.selection()
+        if not selection:
+            return
+        
+        items = [(item_id, searches_tree.item(item_id)) for item_id in selection]
         
-        # Add buttons
-        ttk.Button(buttons_frame, text="Load", command=load_selected).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Delete", command=delete_selected).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Toggle Auto Run", command=toggle_auto_run).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        try:
+            # Toggle every selected search in a single transaction
+            conn = self.db_manager.connect()
+            with conn:
+                conn.executemany(_SQL_SET_AUTO_RUN, [
+                    (item["values"][3] != "Yes", item["text"]) for _, item in items
+                ])
+            
+            # Update treeview
+            for item_id, item in items:
+                auto_run = item["values"][3] == "Yes"
+                searches_tree.item(item_id, values=(
+                    item["values"][0],
+                    item["values"][1],
+                    item["values"][2],
+                    "No" if auto_run else "Yes"
+                ))
+            
+            # Only the auto_run flag changed, the URL list is unaffected
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error updating search: {e}")
     
     def show_scheduler(self):
         """Show scheduler configuration dialog"""
+        # Build the dialog once, later opens only refresh its values
+        if self._scheduler_dialog is None or not self._scheduler_dialog.winfo_exists():
+            self._build_scheduler_dialog()
+            self._reset_scheduler_form()
+        elif self._scheduler_dialog.winfo_viewable():
+            # Already open, keep the user's unsaved edits
+            self._scheduler_dialog.lift()
+        else:
+            self._scheduler_dialog.deiconify()
+            self._scheduler_dialog.lift()
+            self._reset_scheduler_form()
+        
+        self._refresh_sched_status()
+        
+        # Make dialog modal
+        self._scheduler_dialog.grab_set()
+        self._scheduler_dialog.focus_set()
+    
+    def _build_scheduler_dialog(self):
+        """Create the scheduler configuration dialog widgets"""
         # Create a new toplevel window
         dialog = tk.Toplevel(self)
         dialog.title("Scheduler Configuration")
         dialog.geometry("500x300")
         dialog.transient(self)
-        dialog.grab_set()
-        
-        # Make dialog modal
-        dialog.focus_set()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
         
         # Configure dialog layout
         dialog.grid_columnconfigure(0, weight=1)
@@ -674,10 +843,10 @@ class ScraperFrame(ttk.Frame):
         content_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
         
         # Enable scheduler
-        enabled_var = tk.BooleanVar(value=self.config.get("scheduler", "enabled", True))
+        self._sched_enabled_var = tk.BooleanVar()
         ttk.Checkbutton(content_frame, text="Enable Scheduled Scraping", 
-                      variable=enabled_var).grid(row=0, column=0, columnspan=2, 
-                                               sticky="w", padx=5, pady=5)
+                      variable=self._sched_enabled_var).grid(row=0, column=0, columnspan=2, 
+                                                            sticky="w", padx=5, pady=5)
         
         # Scrape frequency
         ttk.Label(content_frame, text="Scrape Every:").grid(row=1, column=0, 
@@ -686,16 +855,16 @@ class ScraperFrame(ttk.Frame):
         frequency_frame = ttk.Frame(content_frame)
         frequency_frame.grid(row=1, column=1, sticky="w", padx=5, pady=5)
         
-        frequency_var = tk.StringVar(value=str(self.config.get("scheduler", "scrape_frequency_hours", 24)))
+        self._sched_frequency_var = tk.StringVar()
         ttk.Spinbox(frequency_frame, from_=1, to=168, increment=1, 
-                  textvariable=frequency_var, width=5).pack(side=tk.LEFT)
+                  textvariable=self._sched_frequency_var, width=5).pack(side=tk.LEFT)
         ttk.Label(frequency_frame, text="Hours").pack(side=tk.LEFT, padx=5)
         
         # Scan when idle
-        idle_var = tk.BooleanVar(value=self.config.get("scheduler", "scan_when_idle", True))
+        self._sched_idle_var = tk.BooleanVar()
         ttk.Checkbutton(content_frame, text="Scan When System is Idle", 
-                      variable=idle_var).grid(row=2, column=0, columnspan=2, 
-                                            sticky="w", padx=5, pady=5)
+                      variable=self._sched_idle_var).grid(row=2, column=0, columnspan=2, 
+                                                         sticky="w", padx=5, pady=5)
         
         # Idle threshold
         ttk.Label(content_frame, text="Idle Threshold:").grid(row=3, column=0, 
@@ -704,57 +873,81 @@ class ScraperFrame(ttk.Frame):
         idle_frame = ttk.Frame(content_frame)
         idle_frame.grid(row=3, column=1, sticky="w", padx=5, pady=5)
         
-        idle_threshold_var = tk.StringVar(value=str(self.config.get("scheduler", "idle_threshold_minutes", 10)))
+        self._sched_idle_threshold_var = tk.StringVar()
         ttk.Spinbox(idle_frame, from_=1, to=60, increment=1, 
-                  textvariable=idle_threshold_var, width=5).pack(side=tk.LEFT)
+                  textvariable=self._sched_idle_threshold_var, width=5).pack(side=tk.LEFT)
         ttk.Label(idle_frame, text="Minutes").pack(side=tk.LEFT, padx=5)
         
         # Run at startup
-        startup_var = tk.BooleanVar(value=self.config.get("scheduler", "run_at_startup", False))
+        self._sched_startup_var = tk.BooleanVar()
         ttk.Checkbutton(content_frame, text="Run at Application Startup", 
-                      variable=startup_var).grid(row=4, column=0, columnspan=2, 
-                                               sticky="w", padx=5, pady=5)
+                      variable=self._sched_startup_var).grid(row=4, column=0, columnspan=2, 
+                                                            sticky="w", padx=5, pady=5)
         
         # Pause on battery
-        battery_var = tk.BooleanVar(value=self.config.get("system", "pause_on_battery", True))
+        self._sched_battery_var = tk.BooleanVar()
         ttk.Checkbutton(content_frame, text="Pause When on Battery Power (Laptops)", 
-                      variable=battery_var).grid(row=5, column=0, columnspan=2, 
-                                               sticky="w", padx=5, pady=5)
+                      variable=self._sched_battery_var).grid(row=5, column=0, columnspan=2, 
+                                                            sticky="w", padx=5, pady=5)
         
         # Status
         status_frame = ttk.LabelFrame(content_frame, text="Scheduler Status")
         status_frame.grid(row=6, column=0, columnspan=2, sticky="ew", padx=5, pady=10)
         
+        # Last run
+        ttk.Label(status_frame, text="Last Run:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        self._sched_last_run_var = tk.StringVar()
+        ttk.Label(status_frame, textvariable=self._sched_last_run_var).grid(row=0, column=1, sticky="w", padx=5, pady=2)
+        
+        # Next run
+        ttk.Label(status_frame, text="Next Run:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
+        self._sched_next_run_var = tk.StringVar()
+        ttk.Label(status_frame, textvariable=self._sched_next_run_var).grid(row=1, column=1, sticky="w", padx=5, pady=2)
+        
+        # Current state
+        ttk.Label(status_frame, text="Current State:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
+        self._sched_state_var = tk.StringVar()
+        ttk.Label(status_frame, textvariable=self._sched_state_var).grid(row=2, column=1, sticky="w", padx=5, pady=2)
+        
+        # Buttons
+        buttons_frame = ttk.Frame(dialog)
+        buttons_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
+        
+        ttk.Button(buttons_frame, text="Save Settings", command=self._save_scheduler_settings).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Run Now", command=self._scheduler_run_now).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Cancel", command=lambda: self._hide_dialog(dialog)).pack(side=tk.RIGHT, padx=5)
+        
+        self._scheduler_dialog = dialog
+    
+    def _reset_scheduler_form(self):
+        """Load the scheduler dialog controls from the current config"""
+        self._sched_enabled_var.set(self._cfg["scheduler"].get("enabled", True))
+        self._sched_frequency_var.set(str(self._cfg["scheduler"].get("scrape_frequency_hours", 24)))
+        self._sched_idle_var.set(self._cfg["scheduler"].get("scan_when_idle", True))
+        self._sched_idle_threshold_var.set(str(self._cfg["scheduler"].get("idle_threshold_minutes", 10)))
+        self._sched_startup_var.set(self._cfg["scheduler"].get("run_at_startup", False))
+        self._sched_battery_var.set(self._cfg["system"].get("pause_on_battery", True))
+    
+    def _refresh_sched_status(self):
+        """Update the scheduler status labels in the scheduler dialog"""
         # Get scheduler status
         scheduler_status = self.scheduler.get_status()
         
         # Last run
-        ttk.Label(status_frame, text="Last Run:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
         last_run = "Never"
         if "last_run" in scheduler_status:
-            try:
-                last_dt = datetime.fromisoformat(scheduler_status["last_run"])
-                last_run = last_dt.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, TypeError):
-                last_run = str(scheduler_status.get("last_run", "Never"))
-                
-        ttk.Label(status_frame, text=last_run).grid(row=0, column=1, sticky="w", padx=5, pady=2)
+            last_run = _fmt_iso(scheduler_status["last_run"])
+            
+        self._sched_last_run_var.set(last_run)
         
         # Next run
-        ttk.Label(status_frame, text="Next Run:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
         next_run = "Not scheduled"
         if "next_run" in scheduler_status:
-            try:
-                next_dt = datetime.fromisoformat(scheduler_status["next_run"])
-                next_run = next_dt.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, TypeError):
-                next_run = str(scheduler_status.get("next_run", "Not scheduled"))
-                
-        ttk.Label(status_frame, text=next_run).grid(row=1, column=1, sticky="w", padx=5, pady=2)
+            next_run = _fmt_iso(scheduler_status["next_run"])
+            
+        self._sched_next_run_var.set(next_run)
         
         # Current state
-        ttk.Label(status_frame, text="Current State:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
-        state = "Unknown"
         if scheduler_status.get("running", False):
             if scheduler_status.get("paused", False):
                 state = "Paused"
@@ -763,74 +956,97 @@ class ScraperFrame(ttk.Frame):
         else:
             state = "Stopped"
             
-        ttk.Label(status_frame, text=state).grid(row=2, column=1, sticky="w", padx=5, pady=2)
-        
-        # Buttons
-        buttons_frame = ttk.Frame(dialog)
-        buttons_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
-        
-        # Function to save settings
-        def save_settings():
-            # Update config
-            self.config.set("scheduler", "enabled", enabled_var.get())
-            self.config.set("scheduler", "scrape_frequency_hours", int(frequency_var.get()))
-            self.config.set("scheduler", "scan_when_idle", idle_var.get())
-            self.config.set("scheduler", "idle_threshold_minutes", int(idle_threshold_var.get()))
-            self.config.set("scheduler", "run_at_startup", startup_var.get())
-            self.config.set("system", "pause_on_battery", battery_var.get())
-            
-            self.config.save()
-            
-            # Restart scheduler if needed
-            if self.scheduler.running:
-                self.scheduler.stop()
-                self.scheduler.start()
-                
-            dialog.destroy()
+        self._sched_state_var.set(state)
+    
+    def _save_scheduler_settings(self):
+        """Save the scheduler dialog settings to config"""
+        # Update config
+        self.config.set("scheduler", "enabled", self._sched_enabled_var.get())
+        self.config.set("scheduler", "scrape_frequency_hours", int(self._sched_frequency_var.get()))
+        self.config.set("scheduler", "scan_when_idle", self._sched_idle_var.get())
+        self.config.set("scheduler", "idle_threshold_minutes", int(self._sched_idle_threshold_var.get()))
+        self.config.set("scheduler", "run_at_startup", self._sched_startup_var.get())
+        self.config.set("system", "pause_on_battery", self._sched_battery_var.get())
+        
+        self._schedule_save()
+        self._snapshot_config()
+        
+        # Restart scheduler if needed
+        if self.scheduler.running:
+            self.scheduler.stop()
+            self.scheduler.start()
             
-            messagebox.showinfo("Settings Saved", 
-                              "Scheduler settings have been saved and applied.")
+        self._hide_dialog(self._scheduler_dialog)
         
-        # Function to run now
-        def run_now():
-            url = self.url_var.get().strip()
-            
-            if not url:
-                messagebox.showerror("Error", "Please enter a URL to scrape.")
-                return
-                
-            result = self.scheduler.run_now(url)
+        messagebox.showinfo("Settings Saved", 
+                          "Scheduler settings have been saved and applied.")
+    
+    def _scheduler_run_now(self):
+        """Ask the scheduler to run a scraping task immediately"""
+        url = self.url_var.get().strip()
+        
+        if not url:
+            messagebox.showerror("Error", "Please enter a URL to scrape.")
+            return
             
-            if result:
-                messagebox.showinfo("Scheduled Task", 
-                                  "Scraping task has been scheduled to run immediately.")
-                dialog.destroy()
-            else:
-                messagebox.showerror("Error", 
-                                   "Failed to schedule immediate scraping task.")
+        result = self.scheduler.run_now(url)
         
-        # Add buttons
-        ttk.Button(buttons_frame, text="Save Settings", command=save_settings).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Run Now", command=run_now).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        if result:
+            messagebox.showinfo("Scheduled Task", 
+                              "Scraping task has been scheduled to run immediately.")
+            self._hide_dialog(self._scheduler_dialog)
+        else:
+            messagebox.showerror("Error", 
+                               "Failed to schedule immediate scraping task.")
     
     def _apply_settings(self):
-        """Apply current scraper settings to config"""
+        """Apply changed scraper settings to config and save once"""
+        if not self._config_dirty:
+            return
+            
         try:
-            # Update config with current UI values
-            self.config.set("scraper", "max_listings", int(self.max_listings_var.get()))
-            self.config.set("scraper", "batch_size", int(self.batch_size_var.get()))
-            self.config.set("scraper", "headless", self.headless_var.get())
-            self.config.set("scraper", "disable_images", self.disable_images_var.get())
-            self.config.set("system", "low_resource_mode", self.low_resource_var.get())
+            # Collect changed UI values per section
+            updates = {}
+            for section, option, var_name, cast in self._config_dirty.values():
+                updates.setdefault(section, {})[option] = cast(getattr(self, var_name).get())
             
-            self.config.save()
+            for section, options in updates.items():
+                self.config.update_section(section, options)
+            
+            self._schedule_save()
+            self._config_dirty.clear()
+            self._snapshot_config()
             
             self._log("Settings applied and saved.")
             
         except Exception as e:
             self._log(f"Error applying settings: {e}", "error")
     
+    def _schedule_save(self):
+        """Mark the config as changed and write it to disk shortly, once per burst"""
+        self._config_save_pending = True
+        if self._config_save_after_id is None:
+            self._config_save_after_id = self.after(500, self._maybe_flush_config)
+    
+    def _maybe_flush_config(self):
+        """Write the config to disk if there are unsaved changes"""
+        self._config_save_after_id = None
+        if not self._config_save_pending:
+            return
+            
+        self._config_save_pending = False
+        try:
+            self.config.save()
+        except Exception as e:
+            self._log(f"Error saving settings: {e}", "error")
+    
+    def _track_config_changes(self):
+        """Record which config-backed controls the user has changed"""
+        for binding in self._CONFIG_BINDINGS:
+            getattr(self, binding[2]).trace_add(
+                "write", lambda *_, b=binding: self._config_dirty.__setitem__(b[:2], b)
+            )
+    
     def start_scraping(self):
         """Start the scraping process"""
         if self.is_scraping:
@@ -858,16 +1074,18 @@ class ScraperFrame(ttk.Frame):
         self._log(f"Starting scraping for URL: {url}")
         
         # Reset progress and stats
-        self.progress_var.set(0)
-        self.progress_text.config(text="0/0 listings (0%)")
-        self.found_var.set("0")
-        self.new_var.set("0")
-        self.updated_var.set("0")
-        self.memory_var.set("Memory: 0 MB")
-        self.cpu_var.set("CPU: 0%")
-        self.time_var.set("Time: 0:00")
-        self.throttle_var.set("No")
-        self.throttle_label.config(foreground="black")
+        self._stats_cache.clear()
+        self._flush_stats({
+            "progress_var": 0,
+            "progress_text": "0/0 listings (0%)",
+            "found_var": "0",
+            "new_var": "0",
+            "updated_var": "0",
+            "memory_var": "Memory: 0 MB",
+            "cpu_var": "CPU: 0%",
+            "time_var": "Time: 0:00",
+            "throttle_var": "No"
+        })
         
         # Record start time
         self.start_time = time.time()
@@ -875,16 +1093,15 @@ class ScraperFrame(ttk.Frame):
         # Start timer update
         self._update_timer()
         
-        # Start scraping in a background thread
+        # Start scraping on the scraper worker
         self.is_scraping = True
-        self.scraper_thread = threading.Thread(target=self._run_scraper, args=(url,), daemon=True)
-        self.scraper_thread.start()
+        self.scraper_future = self._scrape_executor.submit(self._run_scraper, url)
     
     def _run_scraper(self, url):
-        """Run the scraper in a background thread"""
+        """Run the scraper on the scraper worker thread"""
         try:
             # Create scraper instance with current settings
-            self.scraper = ResourceEfficientScraper(self.config, self.db_manager)
+            self.scraper = self.scraper_class(self.config, self.db_manager)
             
             # Override settings with UI values
             self.scraper.max_listings = int(self.max_listings_var.get())
@@ -910,10 +1127,10 @@ class ScraperFrame(ttk.Frame):
     def _scraping_completed(self):
         """Handle completion of scraping"""
         # Update log
-        stats = getattr(self.scraper, "stats", {})
-        self._log(f"Scraping completed. Found: {stats.get('listings_found', 0)}, "
-                f"New: {stats.get('new_listings', 0)}, "
-                f"Updated: {stats.get('updated_listings', 0)}")
+        stats = self.scraper.stats if self.scraper else ScraperStats.zero()
+        self._log(f"Scraping completed. Found: {stats.listings_found}, "
+                f"New: {stats.new_listings}, "
+                f"Updated: {stats.updated_listings}")
         
         # Update UI
         self._update_status("Completed", "green")
@@ -929,17 +1146,47 @@ class ScraperFrame(ttk.Frame):
             
         self._log("Stopping scraping...")
         self._update_status("Stopping...", "orange")
+        self.stop_btn.config(state=tk.DISABLED)
+        self.pause_btn.config(state=tk.DISABLED)
         
-        # Stop the scraper
-        if self.scraper:
+        # Stop the scraper off the Tk thread, driver shutdown can take seconds
+        scraper = self.scraper
+        self.scraper = None
+        if scraper:
+            threading.Thread(target=self._do_stop, args=(scraper,), daemon=True).start()
+        else:
+            self._on_stopped(None)
+    
+    def _do_stop(self, scraper):
+        """
+        Pause and clean up a scraper on a worker thread
+        
+        Args:
+            scraper (ResourceEfficientScraper): Scraper to stop
+        """
+        state = None
+        try:
             # Get scraping state for possible resume
-            self.scraper_state = self.scraper.pause_scraping()
+            state = scraper.pause_scraping()
             
             # Clean up
-            self.scraper.cleanup()
-            self.scraper = None
+            scraper.cleanup()
+        except Exception as e:
+            self._log(f"Error stopping scraper: {e}", "error")
+            
+        self.after(0, self._on_stopped, state)
+    
+    def _on_stopped(self, state):
+        """
+        Update the UI once the scraper has stopped
+        
+        Args:
+            state (dict): Scraping state returned by pause_scraping
+        """
+        self.scraper_state = state
         
         # Reset UI
+        self._update_status("Stopped", "black")
         self._reset_ui()
         
         # Update log
@@ -959,22 +1206,52 @@ class ScraperFrame(ttk.Frame):
             # Change button
             self.pause_btn.config(text="Pause")
             
-            # Resume in a new thread
+            # Resume on the scraper worker, queued behind a run that is still winding down
             url = self.url_var.get().strip()
-            thread = threading.Thread(target=lambda: self.scraper.resume_scraping(
-                self.scraper_state, url), daemon=True)
-            thread.start()
+            self.scraper_future = self._scrape_executor.submit(
+                self.scraper.resume_scraping, self.scraper_state, url)
             
         else:
             # Pause
             self._log("Pausing scraping...")
-            self._update_status("Paused", "orange")
+            self._update_status("Pausing...", "orange")
             
-            # Get state for resume
-            self.scraper_state = self.scraper.pause_scraping()
+            # Driver shutdown happens on a worker, block the button until it's done
+            self.pause_btn.config(state=tk.DISABLED)
+            threading.Thread(target=self._do_pause, args=(self.scraper,), daemon=True).start()
+    
+    def _do_pause(self, scraper):
+        """
+        Pause a scraper on a worker thread
+        
+        Args:
+            scraper (ResourceEfficientScraper): Scraper to pause
+        """
+        try:
+            state = scraper.pause_scraping()
+        except Exception as e:
+            self._log(f"Error pausing scraper: {e}", "error")
+            state = None
             
-            # Change button
-            self.pause_btn.config(text="Resume")
+        self.after(0, self._on_paused, state)
+    
+    def _on_paused(self, state):
+        """
+        Update the UI once the scraper has paused
+        
+        Args:
+            state (dict): Scraping state returned by pause_scraping
+        """
+        # Stopped while the pause was in flight
+        if not self.is_scraping:
+            return
+            
+        # Get state for resume
+        self.scraper_state = state
+        self._update_status("Paused", "orange")
+        
+        # Change button
+        self.pause_btn.config(text="Resume", state=tk.NORMAL)
     
     def _reset_ui(self):
         """Reset UI after scraping completes or stops"""
@@ -989,93 +1266,221 @@ class ScraperFrame(ttk.Frame):
         if not self.is_scraping:
             return
             
+        # Nothing to draw while another tab is showing, just keep ticking
+        if not self.winfo_ismapped():
+            self.after(1000, self._update_timer)
+            return
+            
         # Calculate elapsed time
         elapsed = time.time() - self.start_time
         minutes = int(elapsed // 60)
         seconds = int(elapsed % 60)
         
-        # Update display
-        self.time_var.set(f"Time: {minutes}:{seconds:02d}")
+        # Collect display values, then apply them in one pass
+        pending = {"time_var": f"Time: {minutes}:{seconds:02d}"}
         
-        # Update resource usage
-        if self.scraper:
-            memory_mb = getattr(self.scraper, "stats", {}).get("memory_usage_mb", 0)
-            cpu = getattr(self.scraper, "stats", {}).get("cpu_usage", 0)
+        # Update resource usage (local reference, the worker may clear self.scraper)
+        scraper = self.scraper
+        if scraper:
+            stats = scraper.stats
+            memory_mb = stats.memory_usage_mb
+            cpu = stats.cpu_usage
             
-            self.memory_var.set(f"Memory: {memory_mb:.1f} MB")
-            self.cpu_var.set(f"CPU: {cpu:.1f}%")
+            pending["memory_var"] = f"Memory: {memory_mb:.1f} MB"
+            pending["cpu_var"] = f"CPU: {cpu:.1f}%"
             
             # Check throttling
-            is_throttling = getattr(self.scraper, "is_throttling", False)
-            if is_throttling:
-                self.throttle_var.set("Yes")
-                self.throttle_label.config(foreground="red")
-            else:
-                self.throttle_var.set("No")
-                self.throttle_label.config(foreground="black")
+            is_throttling = getattr(scraper, "is_throttling", False)
+            pending["throttle_var"] = "Yes" if is_throttling else "No"
             
             # Update progress
-            listings_found = getattr(self.scraper, "stats", {}).get("listings_found", 0)
-            max_listings = self.scraper.max_listings
+            listings_found = stats.listings_found
+            max_listings = scraper.max_listings
             
             if max_listings > 0:
                 progress = (listings_found / max_listings) * 100
-                self.progress_var.set(progress)
-                self.progress_text.config(text=f"{listings_found}/{max_listings} listings ({progress:.1f}%)")
+                pending["progress_var"] = progress
+                pending["progress_text"] = f"{listings_found}/{max_listings} listings ({progress:.1f}%)"
                 
             # Update stats
-            self.found_var.set(str(listings_found))
-            self.new_var.set(str(getattr(self.scraper, "stats", {}).get("new_listings", 0)))
-            self.updated_var.set(str(getattr(self.scraper, "stats", {}).get("updated_listings", 0)))
+            pending["found_var"] = str(listings_found)
+            pending["new_var"] = str(stats.new_listings)
+            pending["updated_var"] = str(stats.updated_listings)
+        
+        self._flush_stats(pending)
         
         # Schedule next update
         self.after(1000, self._update_timer)
     
-    def _refresh_results(self):
-        """Refresh the results display with recent listings"""
-        # Clear current results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+    def _flush_stats(self, pending):
+        """
+        Apply stat display values, skipping any that haven't changed
+        
+        Args:
+            pending (dict): Attribute name of the variable (or label) to new value
+        """
+        cache = self._stats_cache
+        for name, value in pending.items():
+            if cache.get(name) == value:
+                continue
+            cache[name] = value
             
-        # Load recent listings
-        conn = self.db_manager.connect()
-        cursor = conn.cursor()
+            if name == "progress_text":
+                self.progress_text.config(text=value)
+            else:
+                getattr(self, name).set(value)
+                
+            if name == "throttle_var":
+                self.throttle_label.config(foreground="red" if value == "Yes" else "black")
+    
+    def _refresh_results(self):
+        """Refresh the results display with recent listings (queried in the background)"""
+        # Newer refreshes supersede results from older ones still in flight
+        self._results_generation += 1
+        threading.Thread(target=self._query_recent_listings,
+                         args=(self._results_generation,), daemon=True).start()
+    
+    def _query_recent_listings(self, generation):
+        """
+        Load and format recent listings on a worker thread
         
+        Args:
+            generation (int): Refresh request the rows belong to
+        """
         try:
-            cursor.execute("""
-            SELECT id, title, price, year, make, model, mileage, location, listing_date
-            FROM car_listings
-            ORDER BY listing_date DESC
-            LIMIT 100
-            """)
-            
-            listings = cursor.fetchall()
-            
-            # Add to treeview
-            for listing in listings:
-                listing_id, title, price, year, make, model, mileage, location, date = listing
-                
-                # Format values
-                price_str = f"${price:,}" if price else ""
-                year_str = str(year) if year else ""
-                mileage_str = f"{mileage:,}" if mileage else ""
-                
-                # Format date
-                try:
-                    date_dt = datetime.fromisoformat(date)
-                    date_str = date_dt.strftime("%Y-%m-%d")
-                except (ValueError, TypeError):
-                    date_str = str(date)
-                
-                self.results_tree.insert("", "end", text=listing_id, values=(
-                    title, price_str, year_str, make, model, mileage_str, location, date_str
-                ))
-                
-            # Update status
-            self.results_status.config(text=f"{len(listings)} listings displayed")
+            # sqlite3 connections are bound to their creating thread, use a private one
+            with closing(sqlite3.connect(self.db_manager.db_path)) as conn:
+                listings = conn.execute(_SQL_RECENT_LISTINGS).fetchall()
+            
+            # Format rows up front, tree items are created a page at a time
+            rows = [self._format_listing_row(listing) for listing in listings]
             
         except Exception as e:
             self._log(f"Error loading results: {e}", "error")
+            return
+        
+        # Hand the rows to the Tk thread
+        self.after(0, self._populate_tree, rows, generation)
+    
+    @staticmethod
+    def _format_listing_row(listing):
+        """
+        Format a car_listings row for the results tree
+        
+        Args:
+            listing (tuple): Row from _SQL_RECENT_LISTINGS
+            
+        Returns:
+            tuple: (listing_id, values) in results column order
+        """
+        listing_id, title, price, year, make, model, mileage, location, date = listing
+        
+        # Format values
+        price_str = f"${price:,}" if price else ""
+        year_str = str(year) if year else ""
+        mileage_str = f"{mileage:,}" if mileage else ""
+        
+        # Dates are stored as ISO 8601, the first 10 characters are the day
+        date_str = "" if date is None else _fmt_iso(date, want_time=False)
+        
+        return listing_id, (title, price_str, year_str, make, model, mileage_str, location, date_str)
+    
+    def _populate_tree(self, rows, generation):
+        """
+        Replace the results tree contents with formatted rows
+        
+        Args:
+            rows (list): (listing_id, values) tuples
+            generation (int): Refresh request the rows belong to
+        """
+        if generation != self._results_generation:
+            return
+            
+        # Clear current results in a single call
+        children = self.results_tree.get_children()
+        if children:
+            self.results_tree.delete(*children)
+        
+        # Show the first page, the rest is added as the user scrolls
+        self._pending_results = rows
+        self._insert_results_page()
+            
+        # Update status
+        self.results_status.config(text=f"{len(rows)} listings displayed")
+    
+    def _insert_results_page(self):
+        """Insert the next page of pending result rows into the results tree"""
+        page = self._pending_results[:self._results_page_size]
+        self._pending_results = self._pending_results[self._results_page_size:]
+        self.bulk_insert_listings(page)
+    
+    def bulk_insert_listings(self, rows):
+        """
+        Append listing rows to the results tree in one batch
+        
+        Args:
+            rows (list): (listing_id, values) tuples, values in results column order
+        """
+        self._bulk_insert(self.results_tree, rows)
+    
+    def _on_results_scroll(self, first, last):
+        """
+        Keep the scrollbar in sync and load more results near the bottom
+        
+        Args:
+            first (str): Top of the visible region as a fraction
+            last (str): Bottom of the visible region as a fraction
+        """
+        self.results_scroll_y.set(first, last)
+        
+        if self._pending_results and float(last) >= 0.9:
+            # Defer so the tree isn't modified from inside its own scroll callback
+            self.after_idle(self._insert_results_page)
+    
+    def _configure_tree_columns(self, tree, columns):
+        """
+        Apply headings and column layout to a treeview
+        
+        Args:
+            tree (ttk.Treeview): Treeview to configure
+            columns (tuple): (column id, heading, width, anchor) tuples
+        """
+        for column_id, heading, width, anchor in columns:
+            tree.heading(column_id, text=heading)
+            tree.column(column_id, width=width, anchor=anchor)
+    
+    def _bulk_insert(self, tree, rows):
+        """
+        Insert rows into a treeview with column layout suspended
+        
+        Args:
+            tree (ttk.Treeview): Treeview to insert into
+            rows (list): (text, values) tuples
+        """
+        if not rows:
+            return
+            
+        tree.configure(displaycolumns=())
+        try:
+            for text, values in rows:
+                tree.insert("", "end", text=text, values=values)
+        finally:
+            tree.configure(displaycolumns="#all")
+    
+    def _get_listing_url(self, listing_id):
+        """
+        Look up the URL of a listing
+        
+        Args:
+            listing_id: Listing ID from the results tree
+            
+        Returns:
+            str: Listing URL, or None if it has none
+        """
+        # Same SQL text on the same connection reuses sqlite3's cached statement
+        with closing(self._conn.execute(self._url_stmt_sql, (listing_id,))) as cursor:
+            row = cursor.fetchone()
+        return row[0] if row and row[0] else None
     
     def _view_selected_listing(self, event=None):
         """View the selected listing"""
@@ -1086,17 +1491,10 @@ class ScraperFrame(ttk.Frame):
         item = self.results_tree.item(selection[0])
         listing_id = item["text"]
         
-        # Get listing URL
-        conn = self.db_manager.connect()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("SELECT url FROM car_listings WHERE id = ?", (listing_id,))
-            result = cursor.fetchone()
+            url = self._get_listing_url(listing_id)
             
-            if result and result[0]:
-                url = result[0]
-                
+            if url:
                 # Open URL in browser
                 import webbrowser
                 webbrowser.open(url)
@@ -1115,17 +1513,10 @@ class ScraperFrame(ttk.Frame):
         item = self.results_tree.item(selection[0])
         listing_id = item["text"]
         
-        # Get listing URL
-        conn = self.db_manager.connect()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("SELECT url FROM car_listings WHERE id = ?", (listing_id,))
-            result = cursor.fetchone()
+            url = self._get_listing_url(listing_id)
             
-            if result and result[0]:
-                url = result[0]
-                
+            if url:
                 # Copy to clipboard
                 self.clipboard_clear()
                 self.clipboard_append(url)
@@ -1146,7 +1537,13 @@ class ScraperFrame(ttk.Frame):
             self.tree_menu.post(event.x_root, event.y_root)
     
     def _log(self, message, level="info"):
-        """Add a message to the log"""
+        """
+        Add a message to the log (safe to call from any thread)
+        
+        Args:
+            message (str): Message to log
+            level (str): Log level used for coloring (info, warning, error)
+        """
         # Add timestamp
         timestamp = datetime.now().strftime("%H:%M:%S")
         
@@ -1154,38 +1551,62 @@ class ScraperFrame(ttk.Frame):
         tag = level.lower()
         log_line = f"[{timestamp}] {message}"
         
-        # Add to queue
-        self.log_queue.append((log_line, tag))
+        # Only queue here, calling into Tk from worker threads isn't safe.
+        # The widget is updated by _drain_logs() on the Tk thread.
+        self._log_q.put((log_line, tag))
+    
+    def _drain_logs(self):
+        """Move queued log lines into the log widget in a single batch, then poll again"""
+        # Reschedule first so a failing widget update can't stop the poller
+        self._drain_after_id = self.after(self._log_poll_ms, self._drain_logs)
         
-        # Trim queue if too long
-        if len(self.log_queue) > self.max_log_entries:
-            self.log_queue.pop(0)
-            
-        # Update log text
-        self._update_log()
+        batch = []
+        try:
+            while True:
+                batch.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            # Update log text
+            self._append_log(batch)
     
     def _clear_log(self):
         """Clear the log display"""
-        self.log_queue = []
+        # Discard lines that haven't been displayed yet
+        try:
+            while True:
+                self._log_q.get_nowait()
+        except queue.Empty:
+            pass
+            
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
     
-    def _update_log(self):
-        """Update the log text widget with current queue"""
-        self.log_text.config(state=tk.NORMAL)
+    def _append_log(self, lines):
+        """
+        Append lines to the log text widget, keeping only the newest entries
         
-        # Clear current content
-        self.log_text.delete(1.0, tk.END)
+        Args:
+            lines (list): (line, tag) tuples to append
+        """
+        # Only the newest max_log_entries lines can survive the trim below
+        lines = lines[-self.max_log_entries:]
         
-        # Add tags for coloring
-        self.log_text.tag_configure("info", foreground="black")
-        self.log_text.tag_configure("error", foreground="red")
-        self.log_text.tag_configure("warning", foreground="orange")
+        self.log_text.config(state=tk.NORMAL)
         
-        # Add each log line with appropriate tag
-        for line, tag in self.log_queue:
-            self.log_text.insert(tk.END, f"{line}\n", tag)
+        # Insert the whole batch with a single Tk call (text, tag, text, tag, ...)
+        insert_args = []
+        for line, tag in lines:
+            insert_args.append(f"{line}\n")
+            insert_args.append(tag)
+        self.log_text.insert(tk.END, *insert_args)
+        
+        # Drop the oldest lines once the widget holds more than max_log_entries
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > self.max_log_entries:
+            self.log_text.delete("1.0", f"{line_count - self.max_log_entries + 1}.0")
             
         # Scroll to end
         self.log_text.see(tk.END)
@@ -1199,6 +1620,9 @@ class ScraperFrame(ttk.Frame):
     
     def refresh(self):
         """Refresh the scraper frame"""
+        # Pick up config changes made elsewhere (e.g. settings frame)
+        self._snapshot_config()
+        
         # Reload saved searches
         self._load_saved_searches()
         
@@ -1206,19 +1630,45 @@ class ScraperFrame(ttk.Frame):
         self._refresh_results()
         
         # Apply settings from config
-        self.max_listings_var.set(str(self.config.get("scraper", "max_listings", 500)))
-        self.batch_size_var.set(str(self.config.get("scraper", "batch_size", 50)))
-        self.headless_var.set(self.config.get("scraper", "headless", True))
-        self.disable_images_var.set(self.config.get("scraper", "disable_images", True))
-        self.low_resource_var.set(self.config.get("system", "low_resource_mode", False))
+        self.max_listings_var.set(str(self._cfg["scraper"].get("max_listings", 500)))
+        self.batch_size_var.set(str(self._cfg["scraper"].get("batch_size", 50)))
+        self.headless_var.set(self._cfg["scraper"].get("headless", True))
+        self.disable_images_var.set(self._cfg["scraper"].get("disable_images", True))
+        self.low_resource_var.set(self._cfg["system"].get("low_resource_mode", False))
+        
+        # Controls now match the config, nothing to write back
+        self._config_dirty.clear()
+    
+    def _cleanup_scraper(self, scraper):
+        """
+        Release a scraper's browser resources, ignoring errors
+        
+        Args:
+            scraper (ResourceEfficientScraper): Scraper to clean up
+        """
+        try:
+            scraper.cleanup()
+        except Exception:
+            pass
     
     def cleanup(self):
         """Clean up resources when frame is unloaded"""
-        # Stop scraping if active
+        # Stop the log poller
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+            
+        # Write out any settings still waiting on the debounced save
+        if self._config_save_after_id is not None:
+            self.after_cancel(self._config_save_after_id)
+        self._maybe_flush_config()
+            
+        # Stop scraping if active. Not a daemon thread, so the process waits for
+        # the browser driver to quit instead of leaving it running.
         if self.is_scraping and self.scraper:
-            try:
-                self.scraper.cleanup()
-            except:
-                pass
+            threading.Thread(target=self._cleanup_scraper, args=(self.scraper,)).start()
                 
-        self.scraper = None
\ No newline at end of file
+        self.scraper = None
+        
+        # Don't block shutdown on a run that is still winding down
+        self._scrape_executor.shutdown(wait=False)
\ No newline at end of file
@@ -4,26 +4,99 @@ Settings configuration frame
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import os
+import ctypes
 import platform
-from typing import Dict, List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Callable
 
 # Local imports
 from src.utils.config import Config
+from src.database.db_manager import DatabaseManager
+from src.scraper.scheduler import TaskScheduler
 from src.ui.theme_manager import ThemeManager
 
+# Platform and home directory don't change while the app runs
+_IS_WINDOWS = platform.system() == "Windows"
+_HOME = os.path.expanduser("~")
+
+# Views the app can open at startup
+_DEFAULT_VIEWS = ("Dashboard", "Scraper", "Analysis", "Settings")
+
+# Windows integration buttons as (text, handler method name)
+_WINDOWS_ACTIONS = (
+    ("Register with Windows Task Scheduler", "_register_task_scheduler"),
+    ("Remove from Windows Task Scheduler", "_remove_task_scheduler"),
+    ("Add to Windows Startup", "_add_to_startup"),
+)
+
 
 class SettingsFrame(ttk.Frame):
     """Frame for configuring application settings"""
     
+    # Checkbutton settings, each backed by a BooleanVar in _bool_vars
+    _BOOL_SETTINGS = (
+        "compression", "minimize", "autostart", "start_min", "check_updates",
+        "auto_update", "animations", "low_resource", "battery", "headless",
+        "disable_images", "simple_parser", "precompute", "cache", "save_html",
+    )
+    
+    # Settings controls as (control variable, section, option, default), by tab.
+    # The variables are typed (IntVar, DoubleVar, ...) so no cast is needed.
+    _SCHEMA = (
+        # General tab
+        ("db_path_var", "database", "path", ""),
+        ("retention_var", "database", "retention_days", 90),
+        ("compression", "database", "compression_enabled", True),
+        ("minimize", "ui", "minimize_to_tray", True),
+        ("autostart", "scheduler", "run_at_startup", False),
+        ("start_min", "ui", "start_minimized", False),
+        ("default_view_var", "ui", "default_view", "Dashboard"),
+        ("check_updates", "updates", "check_on_startup", True),
+        ("auto_update", "updates", "auto_update", False),
+        # Appearance tab
+        ("theme_var", "ui", "theme", "system"),
+        ("font_size_var", "ui", "font_size", 10),
+        ("animations", "ui", "enable_animations", True),
+        ("refresh_var", "ui", "refresh_rate_ms", 1000),
+        # Performance tab
+        ("memory_limit_var", "system", "memory_limit_mb", 512),
+        ("cpu_limit_var", "system", "cpu_usage_limit", 50),
+        ("low_resource", "system", "low_resource_mode", False),
+        ("battery", "system", "pause_on_battery", True),
+        ("batch_size_var", "scraper", "batch_size", 50),
+        ("headless", "scraper", "headless", True),
+        ("disable_images", "scraper", "disable_images", True),
+        ("simple_parser", "scraper", "use_simplified_parser", False),
+        ("precompute", "analysis", "precompute_common_metrics", True),
+        ("cache", "analysis", "cache_results", True),
+        ("cache_ttl_var", "analysis", "cache_ttl_minutes", 60),
+        # Advanced tab
+        ("vacuum_var", "database", "vacuum_threshold", 0.2),
+        ("retry_var", "scraper", "retry_attempts", 3),
+        ("backoff_var", "scraper", "backoff_factor", 2.0),
+        ("save_html", "scraper", "save_raw_html", False),
+    )
+    
     def __init__(self, parent, config: Config, theme_manager: ThemeManager,
-                apply_theme_callback: Callable):
+                apply_theme_callback: Callable,
+                settings_changed_callback: Optional[Callable] = None):
         """Initialize the settings frame"""
         super().__init__(parent)
         self.parent = parent
         self.config = config
         self.theme_manager = theme_manager
         self.apply_theme_callback = apply_theme_callback
+        self.settings_changed_callback = settings_changed_callback
+        
+        # Database manager for maintenance actions, created on first use. VACUUM
+        # and ANALYZE run on a single worker so they don't block the Tk thread.
+        self._db_manager = None
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-maintenance")
+        
+        # Scheduler for Windows Task Scheduler integration, created on first use
+        self._scheduler = None
         
         # Configure grid layout
         self.grid_columnconfigure(0, weight=1)
@@ -31,7 +104,24 @@ class SettingsFrame(ttk.Frame):
         self.grid_rowconfigure(1, weight=1)  # Content
         self.grid_rowconfigure(2, weight=0)  # Buttons
         
-        # Create UI elements
+        # Create UI elements, only the General tab is built up front
+        self._example_font = None
+        self._font_after_id = None
+        self._theme_after_id = None
+        self._theme_apply_id = None
+        
+        # Theme last applied, <<ComboboxSelected>> also fires when the selection didn't change
+        self._last_theme = theme_manager.current_theme
+        
+        # Config sections as of the last _load_settings, lets refresh() skip unchanged ones
+        self._loaded_sections: Dict[str, Dict[str, Any]] = {}
+        
+        self._create_variables()
+        
+        # Spinbox key validation, rejects non-numeric edits before they reach the variable
+        self._int_vcmd = (self.register(self._validate_int), "%P")
+        self._float_vcmd = (self.register(self._validate_float), "%P")
+        
         self._create_header()
         self._create_content()
         self._create_footer()
@@ -39,6 +129,79 @@ class SettingsFrame(ttk.Frame):
         # Load current settings
         self._load_settings()
     
+    def _create_variables(self):
+        """Create the Tk variables for every tab, tabs bind to them when they are built"""
+        # General tab
+        self.db_path_var = tk.StringVar()
+        self.retention_var = tk.IntVar()
+        self.default_view_var = tk.StringVar()
+        
+        # Appearance tab
+        self.theme_var = tk.StringVar()
+        self.font_size_var = tk.IntVar()
+        self.refresh_var = tk.IntVar()
+        
+        # Performance tab
+        self.memory_limit_var = tk.IntVar()
+        self.cpu_limit_var = tk.IntVar()
+        self.batch_size_var = tk.IntVar()
+        self.cache_ttl_var = tk.IntVar()
+        
+        # Advanced tab
+        self.vacuum_var = tk.DoubleVar()
+        self.retry_var = tk.IntVar()
+        self.backoff_var = tk.DoubleVar()
+        
+        # Checkbutton variables, keyed by their _SCHEMA name
+        self._bool_vars = {name: tk.BooleanVar() for name in self._BOOL_SETTINGS}
+    
+    def _control_var(self, name):
+        """
+        Look up a settings control variable by its _SCHEMA name
+        
+        Args:
+            name (str): Checkbutton key in _bool_vars, or a variable attribute name
+            
+        Returns:
+            tk.Variable: Control variable
+        """
+        try:
+            return self._bool_vars[name]
+        except KeyError:
+            return getattr(self, name)
+    
+    @staticmethod
+    def _validate_int(text):
+        """
+        Validate a proposed integer spinbox value
+        
+        Args:
+            text (str): Spinbox text after the edit
+            
+        Returns:
+            bool: True if the edit is allowed
+        """
+        return text == "" or text.isdigit()
+    
+    @staticmethod
+    def _validate_float(text):
+        """
+        Validate a proposed decimal spinbox value
+        
+        Args:
+            text (str): Spinbox text after the edit
+            
+        Returns:
+            bool: True if the edit is allowed
+        """
+        if text in ("", "."):
+            return True
+        try:
+            float(text)
+            return True
+        except ValueError:
+            return False
+    
     def _create_header(self):
         """Create the settings header"""
         header_frame = ttk.Frame(self)
@@ -73,11 +236,21 @@ class SettingsFrame(ttk.Frame):
         self.notebook.add(self.performance_tab, text="Performance")
         self.notebook.add(self.advanced_tab, text="Advanced")
         
-        # Create tab contents
+        # Build the General tab now, the rest the first time they are shown
         self._create_general_tab()
-        self._create_appearance_tab()
-        self._create_performance_tab()
-        self._create_advanced_tab()
+        self._tab_builders = {
+            self.appearance_tab: self._create_appearance_tab,
+            self.performance_tab: self._create_performance_tab,
+            self.advanced_tab: self._create_advanced_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_shown)
+    
+    def _on_tab_shown(self, event):
+        """Build a tab's widgets the first time it is selected"""
+        tab = self.notebook.nametowidget(self.notebook.select())
+        builder = self._tab_builders.pop(tab, None)
+        if builder:
+            builder()
     
     def _create_general_tab(self):
         """Create general settings tab"""
@@ -87,88 +260,70 @@ class SettingsFrame(ttk.Frame):
         # Database settings
         db_frame = ttk.LabelFrame(self.general_tab, text="Database Settings")
         db_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+        db_frame.grid_columnconfigure(2, weight=1)
         
         # Database path
-        path_frame = ttk.Frame(db_frame)
-        path_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(path_frame, text="Database Location:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(db_frame, text="Database Location:").grid(row=0, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.db_path_var = tk.StringVar()
-        path_entry = ttk.Entry(path_frame, textvariable=self.db_path_var, width=40)
-        path_entry.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
-        path_frame.grid_columnconfigure(1, weight=1)
+        path_entry = ttk.Entry(db_frame, textvariable=self.db_path_var, width=40)
+        path_entry.grid(row=0, column=1, columnspan=2, sticky="ew", padx=5, pady=5)
         
-        browse_btn = ttk.Button(path_frame, text="Browse", command=self._browse_db_path)
-        browse_btn.grid(row=0, column=2, padx=5, pady=5)
+        browse_btn = ttk.Button(db_frame, text="Browse", command=self._browse_db_path)
+        browse_btn.grid(row=0, column=3, padx=(5, 15), pady=5)
         
         # Data retention period
-        retention_frame = ttk.Frame(db_frame)
-        retention_frame.pack(fill="x", padx=10, pady=5)
+        ttk.Label(db_frame, text="Data Retention:").grid(row=1, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        ttk.Label(retention_frame, text="Data Retention:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        retention_spinbox = ttk.Spinbox(db_frame, from_=1, to=365, increment=1, 
+                                      textvariable=self.retention_var, width=5,
+                                      validate="key", validatecommand=self._int_vcmd)
+        retention_spinbox.grid(row=1, column=1, sticky="w", padx=5, pady=5)
         
-        self.retention_var = tk.StringVar()
-        retention_spinbox = ttk.Spinbox(retention_frame, from_=1, to=365, increment=1, 
-                                      textvariable=self.retention_var, width=5)
-        retention_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
-        
-        ttk.Label(retention_frame, text="days").grid(row=0, column=2, sticky="w", padx=5, pady=5)
+        ttk.Label(db_frame, text="days").grid(row=1, column=2, sticky="w", padx=5, pady=5)
         
         # Database compression
-        self.compression_var = tk.BooleanVar()
         compress_check = ttk.Checkbutton(db_frame, text="Enable Database Compression", 
-                                       variable=self.compression_var)
-        compress_check.pack(anchor="w", padx=15, pady=5)
+                                       variable=self._bool_vars["compression"])
+        compress_check.grid(row=2, column=0, columnspan=4, sticky="w", padx=15, pady=5)
         
         # Startup settings
         startup_frame = ttk.LabelFrame(self.general_tab, text="Startup Settings")
         startup_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
         
         # Minimize to tray
-        self.minimize_var = tk.BooleanVar()
         minimize_check = ttk.Checkbutton(startup_frame, text="Minimize to System Tray on Close", 
-                                       variable=self.minimize_var)
-        minimize_check.pack(anchor="w", padx=15, pady=5)
+                                       variable=self._bool_vars["minimize"])
+        minimize_check.grid(row=0, column=0, columnspan=2, sticky="w", padx=15, pady=5)
         
         # Start with system
-        self.autostart_var = tk.BooleanVar()
         autostart_check = ttk.Checkbutton(startup_frame, text="Start with Windows", 
-                                        variable=self.autostart_var)
-        autostart_check.pack(anchor="w", padx=15, pady=5)
+                                        variable=self._bool_vars["autostart"])
+        autostart_check.grid(row=1, column=0, columnspan=2, sticky="w", padx=15, pady=5)
         
         # Start minimized
-        self.start_min_var = tk.BooleanVar()
         start_min_check = ttk.Checkbutton(startup_frame, text="Start Minimized", 
-                                        variable=self.start_min_var)
-        start_min_check.pack(anchor="w", padx=15, pady=5)
+                                        variable=self._bool_vars["start_min"])
+        start_min_check.grid(row=2, column=0, columnspan=2, sticky="w", padx=15, pady=5)
         
         # Default view
-        default_frame = ttk.Frame(startup_frame)
-        default_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(default_frame, text="Default View:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(startup_frame, text="Default View:").grid(row=3, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.default_view_var = tk.StringVar()
-        views = ["Dashboard", "Scraper", "Analysis", "Settings"]
-        default_combo = ttk.Combobox(default_frame, textvariable=self.default_view_var, 
-                                    values=views, width=15, state="readonly")
-        default_combo.grid(row=0, column=1, sticky="w", padx=5, pady=5)
+        default_combo = ttk.Combobox(startup_frame, textvariable=self.default_view_var, 
+                                    values=_DEFAULT_VIEWS, width=15, state="readonly")
+        default_combo.grid(row=3, column=1, sticky="w", padx=5, pady=5)
         
         # Updates
         updates_frame = ttk.LabelFrame(self.general_tab, text="Updates")
         updates_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
         
         # Check for updates
-        self.check_updates_var = tk.BooleanVar()
         updates_check = ttk.Checkbutton(updates_frame, text="Check for Updates on Startup", 
-                                      variable=self.check_updates_var)
+                                      variable=self._bool_vars["check_updates"])
         updates_check.pack(anchor="w", padx=15, pady=5)
         
         # Auto update
-        self.auto_update_var = tk.BooleanVar()
         auto_update_check = ttk.Checkbutton(updates_frame, text="Download Updates Automatically", 
-                                          variable=self.auto_update_var)
+                                          variable=self._bool_vars["auto_update"])
         auto_update_check.pack(anchor="w", padx=15, pady=5)
     
     def _create_appearance_tab(self):
@@ -181,15 +336,13 @@ class SettingsFrame(ttk.Frame):
         theme_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         
         # Theme selection
-        theme_select_frame = ttk.Frame(theme_frame)
-        theme_select_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(theme_select_frame, text="Application Theme:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(theme_frame, text="Application Theme:").grid(row=0, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.theme_var = tk.StringVar()
-        themes = self.theme_manager.get_available_themes()
-        theme_combo = ttk.Combobox(theme_select_frame, textvariable=self.theme_var, 
-                                 values=themes, width=15, state="readonly")
+        # Theme list is fetched when the dropdown opens
+        theme_combo = ttk.Combobox(theme_frame, textvariable=self.theme_var, 
+                                 width=15, state="readonly",
+                                 postcommand=lambda: theme_combo.configure(
+                                     values=self.theme_manager.get_available_themes()))
         theme_combo.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         
         # Bind theme change
@@ -198,52 +351,49 @@ class SettingsFrame(ttk.Frame):
         # Font settings
         font_frame = ttk.LabelFrame(self.appearance_tab, text="Font Settings")
         font_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
+        font_frame.grid_columnconfigure(1, weight=1)
         
         # Font size
-        font_size_frame = ttk.Frame(font_frame)
-        font_size_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(font_size_frame, text="UI Font Size:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(font_frame, text="UI Font Size:").grid(row=0, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.font_size_var = tk.StringVar()
-        size_spinbox = ttk.Spinbox(font_size_frame, from_=8, to=16, increment=1, 
-                                  textvariable=self.font_size_var, width=5)
+        size_spinbox = ttk.Spinbox(font_frame, from_=8, to=16, increment=1, 
+                                  textvariable=self.font_size_var, width=5,
+                                  validate="key", validatecommand=self._int_vcmd)
         size_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         
         # Font example
         font_example = ttk.LabelFrame(font_frame, text="Example Text")
-        font_example.pack(fill="x", padx=10, pady=10)
+        font_example.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
         
+        # One font for the frame's lifetime, size changes reconfigure it in place
+        self._example_font = tkfont.Font(family="Arial", size=10)
         self.example_label = ttk.Label(font_example, 
                                      text="This is example text with the current font settings.",
-                                     padding=10)
+                                     font=self._example_font, padding=10)
         self.example_label.pack(fill="x")
         
         # Bind font size change
         self.font_size_var.trace_add("write", self._on_font_size_changed)
+        self._update_example_text()
         
         # UI settings
         ui_frame = ttk.LabelFrame(self.appearance_tab, text="UI Settings")
         ui_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
         
         # Enable animations
-        self.animations_var = tk.BooleanVar()
         anim_check = ttk.Checkbutton(ui_frame, text="Enable UI Animations", 
-                                   variable=self.animations_var)
-        anim_check.pack(anchor="w", padx=15, pady=5)
+                                   variable=self._bool_vars["animations"])
+        anim_check.grid(row=0, column=0, columnspan=3, sticky="w", padx=15, pady=5)
         
         # UI refresh rate
-        refresh_frame = ttk.Frame(ui_frame)
-        refresh_frame.pack(fill="x", padx=10, pady=5)
+        ttk.Label(ui_frame, text="UI Refresh Rate:").grid(row=1, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        ttk.Label(refresh_frame, text="UI Refresh Rate:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        refresh_spinbox = ttk.Spinbox(ui_frame, from_=500, to=5000, increment=100, 
+                                    textvariable=self.refresh_var, width=5,
+                                    validate="key", validatecommand=self._int_vcmd)
+        refresh_spinbox.grid(row=1, column=1, sticky="w", padx=5, pady=5)
         
-        self.refresh_var = tk.StringVar()
-        refresh_spinbox = ttk.Spinbox(refresh_frame, from_=500, to=5000, increment=100, 
-                                    textvariable=self.refresh_var, width=5)
-        refresh_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
-        
-        ttk.Label(refresh_frame, text="ms").grid(row=0, column=2, sticky="w", padx=5, pady=5)
+        ttk.Label(ui_frame, text="ms").grid(row=1, column=2, sticky="w", padx=5, pady=5)
     
     def _create_performance_tab(self):
         """Create performance settings tab"""
@@ -255,109 +405,90 @@ class SettingsFrame(ttk.Frame):
         resource_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         
         # Memory limit
-        memory_frame = ttk.Frame(resource_frame)
-        memory_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(memory_frame, text="Memory Limit:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(resource_frame, text="Memory Limit:").grid(row=0, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.memory_limit_var = tk.StringVar()
-        memory_spinbox = ttk.Spinbox(memory_frame, from_=128, to=4096, increment=64, 
-                                    textvariable=self.memory_limit_var, width=5)
+        memory_spinbox = ttk.Spinbox(resource_frame, from_=128, to=4096, increment=64, 
+                                    textvariable=self.memory_limit_var, width=5,
+                                    validate="key", validatecommand=self._int_vcmd)
         memory_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         
-        ttk.Label(memory_frame, text="MB").grid(row=0, column=2, sticky="w", padx=5, pady=5)
+        ttk.Label(resource_frame, text="MB").grid(row=0, column=2, sticky="w", padx=5, pady=5)
         
         # CPU limit
-        cpu_frame = ttk.Frame(resource_frame)
-        cpu_frame.pack(fill="x", padx=10, pady=5)
+        ttk.Label(resource_frame, text="CPU Usage Limit:").grid(row=1, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        ttk.Label(cpu_frame, text="CPU Usage Limit:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        cpu_spinbox = ttk.Spinbox(resource_frame, from_=10, to=95, increment=5, 
+                                textvariable=self.cpu_limit_var, width=5,
+                                validate="key", validatecommand=self._int_vcmd)
+        cpu_spinbox.grid(row=1, column=1, sticky="w", padx=5, pady=5)
         
-        self.cpu_limit_var = tk.StringVar()
-        cpu_spinbox = ttk.Spinbox(cpu_frame, from_=10, to=95, increment=5, 
-                                textvariable=self.cpu_limit_var, width=5)
-        cpu_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
-        
-        ttk.Label(cpu_frame, text="%").grid(row=0, column=2, sticky="w", padx=5, pady=5)
+        ttk.Label(resource_frame, text="%").grid(row=1, column=2, sticky="w", padx=5, pady=5)
         
         # Low resource mode
-        self.low_resource_var = tk.BooleanVar()
         low_resource_check = ttk.Checkbutton(resource_frame, 
                                           text="Enable Low Resource Mode (for older systems)", 
-                                          variable=self.low_resource_var)
-        low_resource_check.pack(anchor="w", padx=15, pady=5)
+                                          variable=self._bool_vars["low_resource"])
+        low_resource_check.grid(row=2, column=0, columnspan=3, sticky="w", padx=15, pady=5)
         
         # Battery options
-        self.battery_var = tk.BooleanVar()
         battery_check = ttk.Checkbutton(resource_frame, 
                                       text="Pause Scraping When on Battery Power", 
-                                      variable=self.battery_var)
-        battery_check.pack(anchor="w", padx=15, pady=5)
+                                      variable=self._bool_vars["battery"])
+        battery_check.grid(row=3, column=0, columnspan=3, sticky="w", padx=15, pady=5)
         
         # Scraper performance settings
         scraper_frame = ttk.LabelFrame(self.performance_tab, text="Scraper Performance")
         scraper_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
         
         # Batch size
-        batch_frame = ttk.Frame(scraper_frame)
-        batch_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(batch_frame, text="Batch Size:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(scraper_frame, text="Batch Size:").grid(row=0, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.batch_size_var = tk.StringVar()
-        batch_spinbox = ttk.Spinbox(batch_frame, from_=10, to=200, increment=10, 
-                                  textvariable=self.batch_size_var, width=5)
+        batch_spinbox = ttk.Spinbox(scraper_frame, from_=10, to=200, increment=10, 
+                                  textvariable=self.batch_size_var, width=5,
+                                  validate="key", validatecommand=self._int_vcmd)
         batch_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         
         # Headless mode
-        self.headless_var = tk.BooleanVar()
         headless_check = ttk.Checkbutton(scraper_frame, text="Run Browser in Headless Mode", 
-                                       variable=self.headless_var)
-        headless_check.pack(anchor="w", padx=15, pady=5)
+                                       variable=self._bool_vars["headless"])
+        headless_check.grid(row=1, column=0, columnspan=2, sticky="w", padx=15, pady=5)
         
         # Disable images
-        self.disable_images_var = tk.BooleanVar()
         images_check = ttk.Checkbutton(scraper_frame, text="Disable Image Loading (saves memory)", 
-                                     variable=self.disable_images_var)
-        images_check.pack(anchor="w", padx=15, pady=5)
+                                     variable=self._bool_vars["disable_images"])
+        images_check.grid(row=2, column=0, columnspan=2, sticky="w", padx=15, pady=5)
         
         # Simplified parser
-        self.simple_parser_var = tk.BooleanVar()
         parser_check = ttk.Checkbutton(scraper_frame, 
                                      text="Use Simplified HTML Parser (less accurate, but faster)", 
-                                     variable=self.simple_parser_var)
-        parser_check.pack(anchor="w", padx=15, pady=5)
+                                     variable=self._bool_vars["simple_parser"])
+        parser_check.grid(row=3, column=0, columnspan=2, sticky="w", padx=15, pady=5)
         
         # Analysis performance
         analysis_frame = ttk.LabelFrame(self.performance_tab, text="Analysis Performance")
         analysis_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
         
         # Precompute metrics
-        self.precompute_var = tk.BooleanVar()
         precompute_check = ttk.Checkbutton(analysis_frame, 
                                          text="Precompute Common Metrics (faster analysis, more storage)", 
-                                         variable=self.precompute_var)
-        precompute_check.pack(anchor="w", padx=15, pady=5)
+                                         variable=self._bool_vars["precompute"])
+        precompute_check.grid(row=0, column=0, columnspan=3, sticky="w", padx=15, pady=5)
         
         # Cache results
-        self.cache_var = tk.BooleanVar()
         cache_check = ttk.Checkbutton(analysis_frame, 
                                     text="Cache Analysis Results (saves CPU, uses more memory)", 
-                                    variable=self.cache_var)
-        cache_check.pack(anchor="w", padx=15, pady=5)
+                                    variable=self._bool_vars["cache"])
+        cache_check.grid(row=1, column=0, columnspan=3, sticky="w", padx=15, pady=5)
         
         # Cache TTL
-        cache_frame = ttk.Frame(analysis_frame)
-        cache_frame.pack(fill="x", padx=10, pady=5)
+        ttk.Label(analysis_frame, text="Cache Duration:").grid(row=2, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        ttk.Label(cache_frame, text="Cache Duration:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        cache_spinbox = ttk.Spinbox(analysis_frame, from_=1, to=1440, increment=15, 
+                                  textvariable=self.cache_ttl_var, width=5,
+                                  validate="key", validatecommand=self._int_vcmd)
+        cache_spinbox.grid(row=2, column=1, sticky="w", padx=5, pady=5)
         
-        self.cache_ttl_var = tk.StringVar()
-        cache_spinbox = ttk.Spinbox(cache_frame, from_=1, to=1440, increment=15, 
-                                  textvariable=self.cache_ttl_var, width=5)
-        cache_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
-        
-        ttk.Label(cache_frame, text="minutes").grid(row=0, column=2, sticky="w", padx=5, pady=5)
+        ttk.Label(analysis_frame, text="minutes").grid(row=2, column=2, sticky="w", padx=5, pady=5)
     
     def _create_advanced_tab(self):
         """Create advanced settings tab"""
@@ -365,33 +496,27 @@ class SettingsFrame(ttk.Frame):
         self.advanced_tab.grid_columnconfigure(0, weight=1)
         
         # Warning label
-        warning_frame = ttk.Frame(self.advanced_tab)
-        warning_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        
-        warning_label = ttk.Label(warning_frame, 
+        warning_label = ttk.Label(self.advanced_tab, 
                                 text="Warning: These settings are for advanced users only. "
                                 "Incorrect values may cause performance issues or data loss.",
                                 foreground="red", wraplength=400)
-        warning_label.pack(pady=10)
+        warning_label.grid(row=0, column=0, padx=10, pady=20)
         
         # Database advanced settings
         db_frame = ttk.LabelFrame(self.advanced_tab, text="Advanced Database Settings")
         db_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
         
         # Vacuum threshold
-        vacuum_frame = ttk.Frame(db_frame)
-        vacuum_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(vacuum_frame, text="Vacuum Threshold:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(db_frame, text="Vacuum Threshold:").grid(row=0, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.vacuum_var = tk.StringVar()
-        vacuum_spinbox = ttk.Spinbox(vacuum_frame, from_=0.0, to=1.0, increment=0.1, 
-                                   textvariable=self.vacuum_var, width=5)
+        vacuum_spinbox = ttk.Spinbox(db_frame, from_=0.0, to=1.0, increment=0.1, 
+                                   textvariable=self.vacuum_var, width=5,
+                                   validate="key", validatecommand=self._float_vcmd)
         vacuum_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         
         # Database maintenance buttons
         maint_frame = ttk.Frame(db_frame)
-        maint_frame.pack(fill="x", padx=10, pady=10)
+        maint_frame.grid(row=1, column=0, columnspan=2, sticky="w", padx=10, pady=10)
         
         vacuum_btn = ttk.Button(maint_frame, text="Vacuum Database", 
                               command=self._vacuum_database)
@@ -406,52 +531,35 @@ class SettingsFrame(ttk.Frame):
         scraper_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
         
         # Retry attempts
-        retry_frame = ttk.Frame(scraper_frame)
-        retry_frame.pack(fill="x", padx=10, pady=5)
+        ttk.Label(scraper_frame, text="Retry Attempts:").grid(row=0, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        ttk.Label(retry_frame, text="Retry Attempts:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        
-        self.retry_var = tk.StringVar()
-        retry_spinbox = ttk.Spinbox(retry_frame, from_=1, to=10, increment=1, 
-                                  textvariable=self.retry_var, width=5)
+        retry_spinbox = ttk.Spinbox(scraper_frame, from_=1, to=10, increment=1, 
+                                  textvariable=self.retry_var, width=5,
+                                  validate="key", validatecommand=self._int_vcmd)
         retry_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         
         # Backoff factor
-        backoff_frame = ttk.Frame(scraper_frame)
-        backoff_frame.pack(fill="x", padx=10, pady=5)
-        
-        ttk.Label(backoff_frame, text="Backoff Factor:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(scraper_frame, text="Backoff Factor:").grid(row=1, column=0, sticky="w", padx=(15, 5), pady=5)
         
-        self.backoff_var = tk.StringVar()
-        backoff_spinbox = ttk.Spinbox(backoff_frame, from_=1.0, to=5.0, increment=0.5, 
-                                    textvariable=self.backoff_var, width=5)
-        backoff_spinbox.grid(row=0, column=1, sticky="w", padx=5, pady=5)
+        backoff_spinbox = ttk.Spinbox(scraper_frame, from_=1.0, to=5.0, increment=0.5, 
+                                    textvariable=self.backoff_var, width=5,
+                                    validate="key", validatecommand=self._float_vcmd)
+        backoff_spinbox.grid(row=1, column=1, sticky="w", padx=5, pady=5)
         
         # Save raw HTML
-        self.save_html_var = tk.BooleanVar()
         html_check = ttk.Checkbutton(scraper_frame, text="Save Raw HTML (increases storage usage)", 
-                                   variable=self.save_html_var)
-        html_check.pack(anchor="w", padx=15, pady=5)
+                                   variable=self._bool_vars["save_html"])
+        html_check.grid(row=2, column=0, columnspan=2, sticky="w", padx=15, pady=5)
         
         # Windows integration
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             windows_frame = ttk.LabelFrame(self.advanced_tab, text="Windows Integration")
             windows_frame.grid(row=3, column=0, sticky="ew", padx=10, pady=10)
             
-            # Register with task scheduler
-            task_btn = ttk.Button(windows_frame, text="Register with Windows Task Scheduler", 
-                                command=self._register_task_scheduler)
-            task_btn.pack(anchor="w", padx=15, pady=5)
-            
-            # Remove from task scheduler
-            remove_task_btn = ttk.Button(windows_frame, text="Remove from Windows Task Scheduler", 
-                                      command=self._remove_task_scheduler)
-            remove_task_btn.pack(anchor="w", padx=15, pady=5)
-            
-            # Add to startup folder
-            startup_btn = ttk.Button(windows_frame, text="Add to Windows Startup", 
-                                   command=self._add_to_startup)
-            startup_btn.pack(anchor="w", padx=15, pady=5)
+            # Task scheduler and startup buttons
+            for text, handler in _WINDOWS_ACTIONS:
+                ttk.Button(windows_frame, text=text, 
+                          command=getattr(self, handler)).pack(anchor="w", padx=15, pady=5)
     
     def _create_footer(self):
         """Create the footer with buttons"""
@@ -470,54 +578,39 @@ class SettingsFrame(ttk.Frame):
         reset_btn = ttk.Button(footer_frame, text="Reset to Defaults", command=self._reset_defaults)
         reset_btn.pack(side=tk.LEFT, padx=5)
     
-    def _load_settings(self):
-        """Load current settings from config"""
-        # General tab
-        self.db_path_var.set(self.config.get("database", "path", ""))
-        self.retention_var.set(str(self.config.get("database", "retention_days", 90)))
-        self.compression_var.set(self.config.get("database", "compression_enabled", True))
-        self.minimize_var.set(self.config.get("ui", "minimize_to_tray", True))
-        self.autostart_var.set(self.config.get("scheduler", "run_at_startup", False))
-        self.start_min_var.set(self.config.get("ui", "start_minimized", False))
-        self.default_view_var.set(self.config.get("ui", "default_view", "Dashboard"))
-        self.check_updates_var.set(self.config.get("updates", "check_on_startup", True))
-        self.auto_update_var.set(self.config.get("updates", "auto_update", False))
-        
-        # Appearance tab
-        self.theme_var.set(self.config.get("ui", "theme", "system"))
-        self.font_size_var.set(str(self.config.get("ui", "font_size", 10)))
-        self.animations_var.set(self.config.get("ui", "enable_animations", True))
-        self.refresh_var.set(str(self.config.get("ui", "refresh_rate_ms", 1000)))
-        
-        # Performance tab
-        self.memory_limit_var.set(str(self.config.get("system", "memory_limit_mb", 512)))
-        self.cpu_limit_var.set(str(self.config.get("system", "cpu_usage_limit", 50)))
-        self.low_resource_var.set(self.config.get("system", "low_resource_mode", False))
-        self.battery_var.set(self.config.get("system", "pause_on_battery", True))
-        self.batch_size_var.set(str(self.config.get("scraper", "batch_size", 50)))
-        self.headless_var.set(self.config.get("scraper", "headless", True))
-        self.disable_images_var.set(self.config.get("scraper", "disable_images", True))
-        self.simple_parser_var.set(self.config.get("scraper", "use_simplified_parser", False))
-        self.precompute_var.set(self.config.get("analysis", "precompute_common_metrics", True))
-        self.cache_var.set(self.config.get("analysis", "cache_results", True))
-        self.cache_ttl_var.set(str(self.config.get("analysis", "cache_ttl_minutes", 60)))
+    def _load_settings(self, changed_only: bool = False):
+        """
+        Load current settings from config
+        
+        Args:
+            changed_only (bool): Skip sections that are unchanged since the last load
+        """
+        # Fetch each section once, copied so later config edits show up as changes
+        sections = {}
+        unchanged = set()
+        for var_name, section, option, default in self._SCHEMA:
+            if section not in sections:
+                sections[section] = dict(self.config.get_section(section))
+                if changed_only and self._loaded_sections.get(section) == sections[section]:
+                    unchanged.add(section)
+            
+            # Every var.set() fires its traces, so leave unchanged sections alone
+            if section not in unchanged:
+                self._control_var(var_name).set(sections[section].get(option, default))
         
-        # Advanced tab
-        self.vacuum_var.set(str(self.config.get("database", "vacuum_threshold", 0.2)))
-        self.retry_var.set(str(self.config.get("scraper", "retry_attempts", 3)))
-        self.backoff_var.set(str(self.config.get("scraper", "backoff_factor", 2.0)))
-        self.save_html_var.set(self.config.get("scraper", "save_raw_html", False))
+        self._loaded_sections = sections
         
         # Update example text with current font size
-        self._update_example_text()
+        if len(unchanged) < len(sections):
+            self._update_example_text()
     
     def _browse_db_path(self):
         """Browse for database path"""
         # Get parent directory
-        current_path = self.db_path_var.get()
+        parent = os.path.dirname(self.db_path_var.get())
         
         # Default to home directory if path doesn't exist
-        init_dir = os.path.dirname(current_path) if os.path.exists(os.path.dirname(current_path)) else os.path.expanduser("~")
+        init_dir = parent if parent and os.path.isdir(parent) else _HOME
         
         # Ask for file path
         new_path = filedialog.asksaveasfilename(
@@ -533,10 +626,45 @@ class SettingsFrame(ttk.Frame):
     
     def _on_theme_changed(self, event):
         """Handle theme change"""
+        if self.theme_var.get() == self._last_theme:
+            return
+            
+        # Restyling walks every widget, coalesce quick successive selections
+        if self._theme_after_id is not None:
+            self.after_cancel(self._theme_after_id)
+        self._theme_after_id = self.after(100, self._preview_theme)
+    
+    def _preview_theme(self):
+        """Apply the selected theme for preview"""
+        self._theme_after_id = None
         new_theme = self.theme_var.get()
+        if new_theme == self._last_theme:
+            return
+            
+        # Apply theme for preview
+        self._do_theme_apply(new_theme)
+    
+    def _schedule_theme_apply(self, theme_name):
+        """
+        Apply a theme once Tk is idle, replacing an apply that is still pending
+        
+        Args:
+            theme_name (str): Name of theme to apply
+        """
+        if self._theme_apply_id is not None:
+            self.after_cancel(self._theme_apply_id)
+        self._theme_apply_id = self.after_idle(self._do_theme_apply, theme_name)
+    
+    def _do_theme_apply(self, theme_name):
+        """
+        Apply a theme and notify the main window
         
-        # Apply theme immediately for preview
-        self.theme_manager.apply_theme(new_theme)
+        Args:
+            theme_name (str): Name of theme to apply
+        """
+        self._theme_apply_id = None
+        self.theme_manager.apply_theme(theme_name)
+        self._last_theme = self.theme_manager.current_theme
         
         # Call apply theme callback
         if callable(self.apply_theme_callback):
@@ -544,61 +672,124 @@ class SettingsFrame(ttk.Frame):
     
     def _on_font_size_changed(self, *args):
         """Handle font size change"""
-        self._update_example_text()
+        # Coalesce keystrokes and spin ticks into one reconfigure
+        if self._font_after_id is not None:
+            self.after_cancel(self._font_after_id)
+        self._font_after_id = self.after(100, self._update_example_text)
     
     def _update_example_text(self):
         """Update example text with current font size"""
+        self._font_after_id = None
+        
+        # Appearance tab not built yet
+        if self._example_font is None:
+            return
+            
         try:
-            size = int(self.font_size_var.get())
-            self.example_label.configure(font=("Arial", size))
-        except ValueError:
-            pass
+            size = self.font_size_var.get()
+        except tk.TclError:
+            # Spinbox is mid-edit (e.g. empty)
+            return
+            
+        self._example_font.configure(size=size)
+    
+    def _get_db(self):
+        """
+        Get a connection from the frame's database manager, creating it on first use
+        
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+        if self._db_manager is None:
+            self._db_manager = DatabaseManager(self.config)
+        return self._db_manager.connect()
+    
+    def _close_db(self):
+        """Close the maintenance database connection"""
+        if self._db_manager is not None:
+            self._db_manager.close()
+            self._db_manager = None
     
     def _vacuum_database(self):
         """Vacuum the database to reclaim space"""
         if messagebox.askyesno("Vacuum Database", 
                               "This will optimize the database and reclaim unused space. "
                               "It may take some time. Continue?"):
-            try:
-                # Get database connection
-                from src.database.db_manager import DatabaseManager
-                db_manager = DatabaseManager(self.config)
-                conn = db_manager.connect()
-                
-                # Run vacuum
-                conn.execute("VACUUM")
-                conn.commit()
-                
-                messagebox.showinfo("Database Maintenance", 
-                                  "Database vacuum completed successfully.")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Error vacuuming database: {e}")
+            # Run vacuum on the maintenance worker
+            future = self._db_executor.submit(self._run_maintenance, "VACUUM")
+            self.after(100, self._poll_maintenance, future,
+                      "Database vacuum completed successfully.",
+                      "Error vacuuming database")
     
     def _optimize_database(self):
         """Optimize database indices"""
         if messagebox.askyesno("Optimize Database", 
                               "This will optimize database indices for better performance. "
                               "It may take some time. Continue?"):
-            try:
-                # Get database connection
-                from src.database.db_manager import DatabaseManager
-                db_manager = DatabaseManager(self.config)
-                conn = db_manager.connect()
-                
-                # Run optimization
-                conn.execute("ANALYZE")
-                conn.commit()
-                
-                messagebox.showinfo("Database Maintenance", 
-                                  "Database optimization completed successfully.")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Error optimizing database: {e}")
+            # Run optimization on the maintenance worker
+            future = self._db_executor.submit(self._run_maintenance, "ANALYZE")
+            self.after(100, self._poll_maintenance, future,
+                      "Database optimization completed successfully.",
+                      "Error optimizing database")
+    
+    def _run_maintenance(self, statement):
+        """
+        Run a database maintenance statement on the maintenance worker
+        
+        Args:
+            statement (str): SQL statement to run, e.g. VACUUM or ANALYZE
+        """
+        # The connection is created and only used on the worker thread
+        conn = self._get_db()
+        conn.execute(statement)
+        conn.commit()
+    
+    def _poll_maintenance(self, future, success_message, error_prefix):
+        """
+        Report a maintenance task's result once it has finished
+        
+        Args:
+            future (Future): Task submitted to the maintenance worker
+            success_message (str): Message shown when the task succeeds
+            error_prefix (str): Prefix for the error message when it fails
+        """
+        if not future.done():
+            self.after(100, self._poll_maintenance, future, success_message, error_prefix)
+            return
+            
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Error", f"{error_prefix}: {error}")
+        else:
+            messagebox.showinfo("Database Maintenance", success_message)
+    
+    def _get_scheduler(self):
+        """
+        Get the frame's task scheduler, creating it on first use
+        
+        Returns:
+            TaskScheduler: Scheduler used for Windows Task Scheduler integration
+        """
+        if self._scheduler is None:
+            self._scheduler = TaskScheduler(self.config, None)
+        return self._scheduler
+    
+    def _is_user_admin(self):
+        """
+        Check whether the application is running with administrator rights
+        
+        Returns:
+            bool: True if running as administrator, or if it can't be determined
+        """
+        try:
+            return bool(ctypes.windll.shell32.IsUserAnAdmin())
+        except (AttributeError, OSError):
+            # Let the scheduler try and report its own error
+            return True
     
     def _register_task_scheduler(self):
         """Register with Windows Task Scheduler"""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             messagebox.showinfo("Not Available",
                               "This feature is only available on Windows.")
             return
@@ -606,10 +797,16 @@ class SettingsFrame(ttk.Frame):
         if messagebox.askyesno("Windows Task Scheduler", 
                               "This will register the application to run automatically according "
                               "to your scheduled scraping settings. Continue?"):
+            # Registering as SYSTEM needs admin, don't spawn schtasks just to fail
+            if not self._is_user_admin():
+                messagebox.showerror("Error", 
+                                   "Registering with Windows Task Scheduler requires "
+                                   "administrator rights. Try running the application as Administrator.")
+                return
+                
             try:
                 # Get scheduler instance
-                from src.scraper.scheduler import TaskScheduler
-                scheduler = TaskScheduler(self.config, None)
+                scheduler = self._get_scheduler()
                 
                 # Register with Windows
                 result = scheduler.register_with_windows_scheduler()
@@ -627,7 +824,7 @@ class SettingsFrame(ttk.Frame):
     
     def _remove_task_scheduler(self):
         """Remove from Windows Task Scheduler"""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             messagebox.showinfo("Not Available",
                               "This feature is only available on Windows.")
             return
@@ -636,8 +833,7 @@ class SettingsFrame(ttk.Frame):
                               "This will remove the application from Windows Task Scheduler. Continue?"):
             try:
                 # Get scheduler instance
-                from src.scraper.scheduler import TaskScheduler
-                scheduler = TaskScheduler(self.config, None)
+                scheduler = self._get_scheduler()
                 
                 # Remove from Windows
                 result = scheduler.remove_from_windows_scheduler()
@@ -655,7 +851,7 @@ class SettingsFrame(ttk.Frame):
     
     def _add_to_startup(self):
         """Add application to Windows startup"""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             messagebox.showinfo("Not Available",
                               "This feature is only available on Windows.")
             return
@@ -694,13 +890,10 @@ class SettingsFrame(ttk.Frame):
         try:
             # Update values in config
             self._update_config_values()
+            self._notify_settings_changed()
             
             # Apply theme
-            self.theme_manager.apply_theme(self.theme_var.get())
-            
-            # Call apply theme callback
-            if callable(self.apply_theme_callback):
-                self.apply_theme_callback()
+            self._schedule_theme_apply(self.theme_var.get())
                 
             messagebox.showinfo("Settings", "Settings have been applied.")
             
@@ -715,56 +908,30 @@ class SettingsFrame(ttk.Frame):
             
             # Save to file
             self.config.save()
+            self._notify_settings_changed()
             
             # Apply theme
-            self.theme_manager.apply_theme(self.theme_var.get())
-            
-            # Call apply theme callback
-            if callable(self.apply_theme_callback):
-                self.apply_theme_callback()
+            self._schedule_theme_apply(self.theme_var.get())
                 
             messagebox.showinfo("Settings", "Settings have been saved.")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error saving settings: {e}")
     
+    def _notify_settings_changed(self):
+        """Let listeners pick up updated config values"""
+        if callable(self.settings_changed_callback):
+            self.settings_changed_callback()
+    
     def _update_config_values(self):
         """Update config with values from UI"""
-        # General tab
-        self.config.set("database", "path", self.db_path_var.get())
-        self.config.set("database", "retention_days", int(self.retention_var.get()))
-        self.config.set("database", "compression_enabled", self.compression_var.get())
-        self.config.set("ui", "minimize_to_tray", self.minimize_var.get())
-        self.config.set("scheduler", "run_at_startup", self.autostart_var.get())
-        self.config.set("ui", "start_minimized", self.start_min_var.get())
-        self.config.set("ui", "default_view", self.default_view_var.get())
-        self.config.set("updates", "check_on_startup", self.check_updates_var.get())
-        self.config.set("updates", "auto_update", self.auto_update_var.get())
-        
-        # Appearance tab
-        self.config.set("ui", "theme", self.theme_var.get())
-        self.config.set("ui", "font_size", int(self.font_size_var.get()))
-        self.config.set("ui", "enable_animations", self.animations_var.get())
-        self.config.set("ui", "refresh_rate_ms", int(self.refresh_var.get()))
+        # Group values so each section is written with one update_section call
+        updates: Dict[str, Dict[str, Any]] = {}
+        for var_name, section, option, _ in self._SCHEMA:
+            updates.setdefault(section, {})[option] = self._control_var(var_name).get()
         
-        # Performance tab
-        self.config.set("system", "memory_limit_mb", int(self.memory_limit_var.get()))
-        self.config.set("system", "cpu_usage_limit", int(self.cpu_limit_var.get()))
-        self.config.set("system", "low_resource_mode", self.low_resource_var.get())
-        self.config.set("system", "pause_on_battery", self.battery_var.get())
-        self.config.set("scraper", "batch_size", int(self.batch_size_var.get()))
-        self.config.set("scraper", "headless", self.headless_var.get())
-        self.config.set("scraper", "disable_images", self.disable_images_var.get())
-        self.config.set("scraper", "use_simplified_parser", self.simple_parser_var.get())
-        self.config.set("analysis", "precompute_common_metrics", self.precompute_var.get())
-        self.config.set("analysis", "cache_results", self.cache_var.get())
-        self.config.set("analysis", "cache_ttl_minutes", int(self.cache_ttl_var.get()))
-        
-        # Advanced tab
-        self.config.set("database", "vacuum_threshold", float(self.vacuum_var.get()))
-        self.config.set("scraper", "retry_attempts", int(self.retry_var.get()))
-        self.config.set("scraper", "backoff_factor", float(self.backoff_var.get()))
-        self.config.set("scraper", "save_raw_html", self.save_html_var.get())
+        for section, options in updates.items():
+            self.config.update_section(section, options)
     
     def _reset_defaults(self):
         """Reset settings to defaults"""
@@ -772,6 +939,7 @@ class SettingsFrame(ttk.Frame):
                               "This will reset all settings to their default values. Continue?"):
             # Reset config
             self.config.reset_to_defaults()
+            self._notify_settings_changed()
             
             # Reload settings
             self._load_settings()
@@ -780,9 +948,16 @@ class SettingsFrame(ttk.Frame):
     
     def refresh(self):
         """Refresh settings from config"""
-        self._load_settings()
+        self._load_settings(changed_only=True)
     
     def cleanup(self):
         """Clean up resources"""
-        # Nothing to clean up for this frame
-        pass
\ No newline at end of file
+        # Cancel pending debounced updates
+        for after_id in (self._font_after_id, self._theme_after_id, self._theme_apply_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._font_after_id = self._theme_after_id = self._theme_apply_id = None
+        
+        # Close the maintenance connection on the thread that owns it
+        self._db_executor.submit(self._close_db)
+        self._db_executor.shutdown(wait=False)
\ No newline at end of file
@@ -5,69 +5,160 @@ Theme manager for Windows-styled UI appearance
 import tkinter as tk
 from tkinter import ttk
 import os
+import time
+import functools
 import platform
 import json
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
 # Local imports
 from src.utils.config import Config
 
 
+# The platform doesn't change while the app runs
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_MACOS = platform.system() == "Darwin"
+
+
+# Built-in palettes, read-only so every ThemeManager can share them
+_BUILTIN_THEMES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "light": MappingProxyType({
+        "bg": "#f0f0f0",
+        "fg": "#000000",
+        "accent": "#0078d7",
+        "button_bg": "#e1e1e1",
+        "entry_bg": "#ffffff",
+        "sidebar_bg": "#e6e6e6",
+        "sidebar_fg": "#333333",
+        "border": "#c0c0c0"
+    }),
+    "dark": MappingProxyType({
+        "bg": "#2d2d2d",
+        "fg": "#ffffff",
+        "accent": "#0078d7",
+        "button_bg": "#444444",
+        "entry_bg": "#333333",
+        "sidebar_bg": "#252525",
+        "sidebar_fg": "#e0e0e0",
+        "border": "#555555"
+    }),
+    "blue": MappingProxyType({
+        "bg": "#eff5fb",
+        "fg": "#333333",
+        "accent": "#0069c0",
+        "button_bg": "#d4e4f7",
+        "entry_bg": "#ffffff",
+        "sidebar_bg": "#d8e6f6",
+        "sidebar_fg": "#333333",
+        "border": "#a0c8f0"
+    }),
+    "high_contrast": MappingProxyType({
+        "bg": "#000000",
+        "fg": "#ffffff",
+        "accent": "#ffff00",
+        "button_bg": "#000000",
+        "entry_bg": "#000000",
+        "sidebar_bg": "#000000",
+        "sidebar_fg": "#ffffff",
+        "border": "#ffffff"
+    })
+})
+
+
+# Pure color math, apply_theme calls it with the same few accent colors
+@functools.lru_cache(maxsize=128)
+def _lighten_color(hex_color: str, factor: float = 0.1) -> str:
+    """
+    Lighten a hex color by a factor
+    
+    Args:
+        hex_color (str): Hex color code
+        factor (float): Lightening factor (0-1)
+        
+    Returns:
+        str: Lightened hex color
+    """
+    # Convert hex to RGB via one packed 24-bit int
+    rgb = int.from_bytes(bytes.fromhex(hex_color.lstrip('#')[:6]), 'big')
+    r, g, b = (rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF
+    
+    # Lighten
+    r = min(255, int(r + (255 - r) * factor))
+    g = min(255, int(g + (255 - g) * factor))
+    b = min(255, int(b + (255 - b) * factor))
+    
+    # Convert back to hex
+    return '#' + (r << 16 | g << 8 | b).to_bytes(3, 'big').hex()
+
+
+@functools.lru_cache(maxsize=128)
+def _darken_color(hex_color: str, factor: float = 0.1) -> str:
+    """
+    Darken a hex color by a factor
+    
+    Args:
+        hex_color (str): Hex color code
+        factor (float): Darkening factor (0-1)
+        
+    Returns:
+        str: Darkened hex color
+    """
+    # Convert hex to RGB via one packed 24-bit int
+    rgb = int.from_bytes(bytes.fromhex(hex_color.lstrip('#')[:6]), 'big')
+    r, g, b = (rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF
+    
+    # Darken
+    r = int(r * (1 - factor))
+    g = int(g * (1 - factor))
+    b = int(b * (1 - factor))
+    
+    # Convert back to hex
+    return '#' + (r << 16 | g << 8 | b).to_bytes(3, 'big').hex()
+
+
+def _tcl_word(value) -> str:
+    """
+    Brace-quote a style option value as a single Tcl word
+    
+    Args:
+        value: Color string, or a tuple such as a font spec
+        
+    Returns:
+        str: Tcl word
+    """
+    if isinstance(value, (tuple, list)):
+        value = " ".join(str(part) for part in value)
+    return f"{{{value}}}"
+
+
 class ThemeManager:
     """Manages application themes and styling"""
     
+    # Seconds a detected system theme is reused before asking the OS again
+    SYSTEM_THEME_TTL_SEC = 5.0
+    
     def __init__(self, config: Config):
         """Initialize theme manager"""
         self.config = config
         self.current_theme = "system"
         
+        # Detected system theme, reused for SYSTEM_THEME_TTL_SEC
+        self._system_theme_cache = None
+        self._system_theme_cache_ts = 0.0
+        
+        # Theme name -> (colors, style script) from _build_style_script
+        self._compiled_themes: Dict[str, tuple] = {}
+        
+        # Palette currently applied to ttk, None until the first apply_theme
+        self._applied_colors: Optional[Dict] = None
+        
         # Available theme names
         self.available_themes = ["system", "light", "dark", "blue", "high_contrast"]
         
-        # Theme definitions
-        self.themes = {
-            "system": self._get_system_theme(),
-            "light": {
-                "bg": "#f0f0f0",
-                "fg": "#000000",
-                "accent": "#0078d7",
-                "button_bg": "#e1e1e1",
-                "entry_bg": "#ffffff",
-                "sidebar_bg": "#e6e6e6",
-                "sidebar_fg": "#333333",
-                "border": "#c0c0c0"
-            },
-            "dark": {
-                "bg": "#2d2d2d",
-                "fg": "#ffffff",
-                "accent": "#0078d7",
-                "button_bg": "#444444",
-                "entry_bg": "#333333",
-                "sidebar_bg": "#252525",
-                "sidebar_fg": "#e0e0e0",
-                "border": "#555555"
-            },
-            "blue": {
-                "bg": "#eff5fb",
-                "fg": "#333333",
-                "accent": "#0069c0",
-                "button_bg": "#d4e4f7",
-                "entry_bg": "#ffffff",
-                "sidebar_bg": "#d8e6f6",
-                "sidebar_fg": "#333333",
-                "border": "#a0c8f0"
-            },
-            "high_contrast": {
-                "bg": "#000000",
-                "fg": "#ffffff",
-                "accent": "#ffff00",
-                "button_bg": "#000000",
-                "entry_bg": "#000000",
-                "sidebar_bg": "#000000",
-                "sidebar_fg": "#ffffff",
-                "border": "#ffffff"
-            }
-        }
+        # Theme definitions; built-ins are shared, custom themes are added per instance
+        self.themes: Dict[str, Mapping[str, str]] = dict(_BUILTIN_THEMES)
+        self.themes["system"] = self._get_system_theme()
     
     def _get_system_theme(self) -> Dict:
         """
@@ -76,27 +167,33 @@ class ThemeManager:
         Returns:
             dict: Theme colors based on system settings
         """
+        # Registry reads and subprocesses are slow, the OS theme rarely changes
+        now = time.monotonic()
+        if (self._system_theme_cache is not None
+                and now - self._system_theme_cache_ts < self.SYSTEM_THEME_TTL_SEC):
+            return self._system_theme_cache.copy()
+            
         # Default to light theme
-        system_theme = self.themes["light"].copy()
+        system_theme = dict(_BUILTIN_THEMES["light"])
         
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             try:
                 import winreg
                 
-                # Try to detect Windows dark mode
-                registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-                key = winreg.OpenKey(registry, "Software\\Microsoft\\Windows\\CurrentVersion\\Themes\\Personalize")
-                value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+                # Try to detect Windows dark mode; HKEY_CURRENT_USER can be opened directly
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                    "Software\\Microsoft\\Windows\\CurrentVersion\\Themes\\Personalize") as key:
+                    value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
                 
                 # AppsUseLightTheme = 0 means dark mode is enabled
                 if value == 0:
-                    system_theme = self.themes["dark"].copy()
+                    system_theme = dict(_BUILTIN_THEMES["dark"])
                     
             except Exception:
                 # If detection fails, use light theme
                 pass
                 
-        elif platform.system() == "Darwin":  # macOS
+        elif _IS_MACOS:
             try:
                 # Check if dark mode is enabled on macOS
                 import subprocess
@@ -107,28 +204,30 @@ class ThemeManager:
                 )
                 
                 if "Dark" in result.stdout:
-                    system_theme = self.themes["dark"].copy()
+                    system_theme = dict(_BUILTIN_THEMES["dark"])
                     
             except Exception:
                 # If detection fails, use light theme
                 pass
         
-        return system_theme
+        self._system_theme_cache = system_theme
+        self._system_theme_cache_ts = now
+        return system_theme.copy()
     
-    def apply_theme(self, theme_name: str = None):
+    def apply_theme(self, theme_name: str = None, force: bool = False):
         """
         Apply a theme to the application
         
         Args:
             theme_name (str): Name of theme to apply, or None to use config
+            force (bool): Reapply styles even if the theme is already active
         """
         # Get theme from config if not specified
         if theme_name is None:
             theme_name = self.config.get("ui", "theme", "system")
         
         # Make sure theme exists
-        if theme_name not in self.themes:
-            theme_name = "system"
+        theme_name = self._resolve_theme_name(theme_name)
             
         # Get theme colors
         if theme_name == "system":
@@ -136,62 +235,98 @@ class ThemeManager:
         else:
             colors = self.themes[theme_name]
             
+        # Nothing to do if this palette is already applied; comparing colors
+        # also catches OS-level flips of the system theme
+        if not force and theme_name == self.current_theme and colors == self._applied_colors:
+            return
+            
         # Store current theme
         self.current_theme = theme_name
         
-        # Create a ttk style object
+        # Reuse the compiled script unless the palette changed (system theme flips)
+        compiled = self._compiled_themes.get(theme_name)
+        if compiled is None or compiled[0] != colors:
+            compiled = (dict(colors), self._build_style_script(colors))
+            self._compiled_themes[theme_name] = compiled
+            
+        # Apply every style in one Tcl round-trip
         style = ttk.Style()
+        style.tk.eval(compiled[1])
+        self._applied_colors = compiled[0]
         
-        # Configure ttk styles
-        style.configure("TFrame", background=colors["bg"])
-        style.configure("TLabel", background=colors["bg"], foreground=colors["fg"])
-        style.configure("TButton", background=colors["button_bg"], foreground=colors["fg"])
-        style.configure("TEntry", fieldbackground=colors["entry_bg"], foreground=colors["fg"])
-        style.configure("TNotebook", background=colors["bg"])
-        style.configure("TNotebook.Tab", background=colors["button_bg"], foreground=colors["fg"])
-        
-        # Configure special styles
-        style.configure("Sidebar.TFrame", background=colors["sidebar_bg"])
-        style.configure("Sidebar.TLabel", background=colors["sidebar_bg"], foreground=colors["sidebar_fg"])
-        style.configure("Sidebar.TButton", background=colors["sidebar_bg"], foreground=colors["sidebar_fg"])
-        
-        # Configure Treeview
-        style.configure("Treeview", 
-                      background=colors["entry_bg"],
-                      foreground=colors["fg"],
-                      fieldbackground=colors["entry_bg"])
-        
-        # Configure special elements
-        style.configure("Title.TLabel", 
-                      font=("Arial", 14, "bold"),
-                      background=colors["bg"],
-                      foreground=colors["fg"])
-        
-        style.configure("Subtitle.TLabel", 
-                      font=("Arial", 12),
-                      background=colors["bg"],
-                      foreground=colors["fg"])
-        
-        style.configure("Accent.TButton", 
-                      background=colors["accent"],
-                      foreground="#ffffff")
+        # Save theme to config
+        self.config.set("ui", "theme", theme_name)
+        self.config.schedule_save()
+    
+    @staticmethod
+    def _build_style_script(colors: Dict) -> str:
+        """
+        Build the Tcl script that configures and maps all ttk styles for a theme
         
-        # Map styles for different states
-        style.map("TButton",
-                background=[("active", colors["accent"]), ("pressed", colors["accent"])],
-                foreground=[("active", "#ffffff"), ("pressed", "#ffffff")])
+        Args:
+            colors (dict): Theme colors
+            
+        Returns:
+            str: ttk::style commands separated by newlines
+        """
+        # Look each color up once
+        bg, fg, accent, btn_bg, entry_bg, sb_bg, sb_fg = (
+            colors[key] for key in ("bg", "fg", "accent", "button_bg", "entry_bg",
+                                    "sidebar_bg", "sidebar_fg")
+        )
         
-        style.map("Accent.TButton",
-                background=[("active", self._lighten_color(colors["accent"], 0.1)), 
-                          ("pressed", self._darken_color(colors["accent"], 0.1))])
+        # (style, {option: value}) for ttk::style configure
+        configures = (
+            ("TFrame", {"background": bg}),
+            ("TLabel", {"background": bg, "foreground": fg}),
+            ("TButton", {"background": btn_bg, "foreground": fg}),
+            ("TEntry", {"fieldbackground": entry_bg, "foreground": fg}),
+            ("TNotebook", {"background": bg}),
+            ("TNotebook.Tab", {"background": btn_bg, "foreground": fg}),
+            
+            # Special styles
+            ("Sidebar.TFrame", {"background": sb_bg}),
+            ("Sidebar.TLabel", {"background": sb_bg, "foreground": sb_fg}),
+            ("Sidebar.TButton", {"background": sb_bg, "foreground": sb_fg}),
+            
+            # Treeview
+            ("Treeview", {"background": entry_bg,
+                          "foreground": fg,
+                          "fieldbackground": entry_bg}),
+            
+            # Special elements
+            ("Title.TLabel", {"font": ("Arial", 14, "bold"),
+                              "background": bg,
+                              "foreground": fg}),
+            ("Subtitle.TLabel", {"font": ("Arial", 12),
+                                 "background": bg,
+                                 "foreground": fg}),
+            ("Accent.TButton", {"background": accent, "foreground": "#ffffff"}),
+        )
         
-        style.map("Treeview",
-                background=[("selected", colors["accent"])],
-                foreground=[("selected", "#ffffff")])
+        # (style, {option: [(state, value), ...]}) for ttk::style map
+        maps = (
+            ("TButton", {"background": [("active", accent), ("pressed", accent)],
+                         "foreground": [("active", "#ffffff"), ("pressed", "#ffffff")]}),
+            ("Accent.TButton", {"background": [("active", _lighten_color(accent, 0.1)),
+                                               ("pressed", _darken_color(accent, 0.1))]}),
+            ("Treeview", {"background": [("selected", accent)],
+                          "foreground": [("selected", "#ffffff")]}),
+        )
         
-        # Save theme to config
-        self.config.set("ui", "theme", theme_name)
-        self.config.save()
+        lines = []
+        for style_name, options in configures:
+            args = " ".join(f"-{option} {_tcl_word(value)}" for option, value in options.items())
+            lines.append(f"ttk::style configure {style_name} {args}")
+            
+        for style_name, options in maps:
+            args = " ".join(
+                f"-{option} " + _tcl_word([_tcl_word(part) for spec in specs for part in spec])
+                for option, specs in options.items()
+            )
+            lines.append(f"ttk::style map {style_name} {args}")
+            
+        return "\n".join(lines)
     
     def get_theme_colors(self, theme_name: str = None) -> Dict:
         """
@@ -206,14 +341,30 @@ class ThemeManager:
         if theme_name is None:
             theme_name = self.current_theme
             
-        if theme_name not in self.themes:
-            theme_name = "system"
+        theme_name = self._resolve_theme_name(theme_name)
             
         if theme_name == "system":
             return self._get_system_theme()
         else:
             return self.themes[theme_name]
     
+    def _resolve_theme_name(self, theme_name: str) -> str:
+        """
+        Resolve a theme name, loading a saved custom theme on first use
+        
+        Args:
+            theme_name (str): Name of theme
+            
+        Returns:
+            str: The theme name, or "system" if no such theme exists
+        """
+        if theme_name not in self.themes:
+            colors = self.config.get("ui", "custom_themes", {}).get(theme_name)
+            if colors is None:
+                return "system"
+            self.themes[theme_name] = colors
+        return theme_name
+    
     def get_available_themes(self) -> List[str]:
         """
         Get list of available themes
@@ -233,6 +384,7 @@ class ThemeManager:
         """
         # Add to themes dict
         self.themes[name] = colors
+        self._compiled_themes.pop(name, None)
         
         # Add to available themes if not already there
         if name not in self.available_themes:
@@ -242,59 +394,12 @@ class ThemeManager:
         custom_themes = self.config.get("ui", "custom_themes", {})
         custom_themes[name] = colors
         self.config.set("ui", "custom_themes", custom_themes)
-        self.config.save()
+        self.config.schedule_save()
     
     def load_custom_themes(self):
-        """Load custom themes from config"""
+        """List custom themes from config; their colors are loaded when first used"""
         custom_themes = self.config.get("ui", "custom_themes", {})
         
-        for name, colors in custom_themes.items():
-            self.themes[name] = colors
+        for name in custom_themes:
             if name not in self.available_themes:
                 self.available_themes.append(name)
-    
-    def _lighten_color(self, hex_color: str, factor: float = 0.1) -> str:
-        """
-        Lighten a hex color by a factor
-        
-        Args:
-            hex_color (str): Hex color code
-            factor (float): Lightening factor (0-1)
-            
-        Returns:
-            str: Lightened hex color
-        """
-        # Convert hex to RGB
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        
-        # Lighten
-        r = min(255, int(r + (255 - r) * factor))
-        g = min(255, int(g + (255 - g) * factor))
-        b = min(255, int(b + (255 - b) * factor))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
-    def _darken_color(self, hex_color: str, factor: float = 0.1) -> str:
-        """
-        Darken a hex color by a factor
-        
-        Args:
-            hex_color (str): Hex color code
-            factor (float): Darkening factor (0-1)
-            
-        Returns:
-            str: Darkened hex color
-        """
-        # Convert hex to RGB
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        
-        # Darken
-        r = int(r * (1 - factor))
-        g = int(g * (1 - factor))
-        b = int(b * (1 - factor))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
\ No newline at end of file
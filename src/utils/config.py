@@ -4,9 +4,80 @@ Handles loading, saving, and providing access to application settings
 """
 
 import os
+import copy
 import json
+import hashlib
 import platform
+import threading
 from pathlib import Path
+from types import MappingProxyType
+
+# Use orjson for reading and writing the config file when available (optional dependency)
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+    
+    _loads = json.loads
+
+# Sentinel for options that are not set
+_MISSING = object()
+
+# Default settings, copied for each config; database path depends on the config dir
+_DEFAULT_CONFIG_TEMPLATE = {
+    "system": {
+        "memory_limit_mb": 512,
+        "cpu_usage_limit": 50,
+        "low_resource_mode": False,
+        "pause_on_battery": True,
+        "auto_tune": True,
+    },
+    "scraper": {
+        "headless": True,
+        "disable_images": True,
+        "batch_size": 50,
+        "scroll_pause_time": 1.5,
+        "max_listings": 500,
+        "use_simplified_parser": False,
+        "retry_attempts": 3,
+        "backoff_factor": 2.0,
+    },
+    "database": {
+        "path": None,  # Set per instance from config_dir
+        "compression_enabled": True,
+        "max_size_mb": 500,
+        "vacuum_threshold": 0.2,
+        "retention_days": 90,
+    },
+    "ui": {
+        "theme": "system",
+        "enable_animations": False,
+        "refresh_rate_ms": 1000,
+        "use_system_tray": True,
+        "minimize_to_tray": True,
+        "max_results_per_page": 25,
+    },
+    "analysis": {
+        "precompute_common_metrics": True,
+        "cache_results": True,
+        "cache_ttl_minutes": 60,
+        "parallel_processing": False,
+        "max_chart_points": 100,
+    },
+    "scheduler": {
+        "enabled": True,
+        "scrape_frequency_hours": 24,
+        "scan_when_idle": True,
+        "idle_threshold_minutes": 10,
+        "run_at_startup": False,
+    }
+}
 
 
 class Config:
@@ -29,65 +100,36 @@ class Config:
             
         self.config = self._load_default_config()
         
+        # Digest of the last JSON written, to skip saves that wouldn't change the file
+        self._saved_digest = None
+        
+        # Bumped on every in-memory change, so CachedConfig knows when to drop its cache
+        self.version = 0
+        
+        # Pending schedule_save() timer; saves can run on the timer thread.
+        # _save_lock guards the settings, _dirty, version and the timer and is
+        # never held during file IO. _write_lock serializes the file writes.
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        
         if self.exists():
             self._load_config()
+            
+        # Unsaved changes. A config that has no file yet still needs its first save.
+        self._dirty = not self.exists()
     
     def _load_default_config(self):
         """Load default configuration settings"""
-        return {
-            "system": {
-                "memory_limit_mb": 512,
-                "cpu_usage_limit": 50,
-                "low_resource_mode": False,
-                "pause_on_battery": True,
-                "auto_tune": True,
-            },
-            "scraper": {
-                "headless": True,
-                "disable_images": True,
-                "batch_size": 50,
-                "scroll_pause_time": 1.5,
-                "max_listings": 500,
-                "use_simplified_parser": False,
-                "retry_attempts": 3,
-                "backoff_factor": 2.0,
-            },
-            "database": {
-                "path": str(self.config_dir / "car_data.db"),
-                "compression_enabled": True,
-                "max_size_mb": 500,
-                "vacuum_threshold": 0.2,
-                "retention_days": 90,
-            },
-            "ui": {
-                "theme": "system",
-                "enable_animations": False,
-                "refresh_rate_ms": 1000,
-                "use_system_tray": True,
-                "minimize_to_tray": True,
-                "max_results_per_page": 25,
-            },
-            "analysis": {
-                "precompute_common_metrics": True,
-                "cache_results": True,
-                "cache_ttl_minutes": 60,
-                "parallel_processing": False,
-                "max_chart_points": 100,
-            },
-            "scheduler": {
-                "enabled": True,
-                "scrape_frequency_hours": 24,
-                "scan_when_idle": True,
-                "idle_threshold_minutes": 10,
-                "run_at_startup": False,
-            }
-        }
+        config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+        config["database"]["path"] = str(self.config_dir / "car_data.db")
+        return config
     
     def _load_config(self):
         """Load configuration from file, if it exists"""
         try:
-            with open(self.config_file, 'r') as f:
-                user_config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                user_config = _loads(f.read())
                 
             # Merge user configuration with defaults
             for section, options in user_config.items():
@@ -112,26 +154,121 @@ class Config:
     
     def set(self, section, option, value):
         """Set configuration value"""
-        if section not in self.config:
-            self.config[section] = {}
-        self.config[section][option] = value
+        with self._save_lock:
+            if section not in self.config:
+                self.config[section] = {}
+            self.config[section][option] = value
+            self._dirty = True
+            self.version += 1
     
     def save(self):
-        """Save current configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        """Save current configuration to file, if it changed"""
+        with self._write_lock:
+            with self._save_lock:
+                # This save covers any scheduled one
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                    
+                if not self._dirty:
+                    return
+                
+                # Snapshot the settings and mark them clean before writing, so
+                # changes made while the file is written keep the config dirty
+                self._dirty = False
+                version = self.version
+                data = _dumps(self.config)
+            
+            digest = hashlib.blake2b(data, digest_size=8).digest()
+            try:
+                if digest != self._saved_digest:
+                    # Write to a temp file and swap it in, so a crash can't leave a partial config
+                    tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+                    with open(tmp_file, 'wb') as f:
+                        f.write(data)
+                    os.replace(tmp_file, self.config_file)
+                    self._saved_digest = digest
+            except Exception:
+                with self._save_lock:
+                    self._dirty = True
+                raise
+            
+            with self._save_lock:
+                if self.version != version:
+                    self._dirty = True
+    
+    def schedule_save(self, delay=0.5):
+        """
+        Save after a short delay, coalescing calls made in quick succession
+        
+        Args:
+            delay (float): Seconds to wait for further changes before saving
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(delay, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
     
     def reset_to_defaults(self):
         """Reset configuration to default values"""
-        self.config = self._load_default_config()
+        with self._save_lock:
+            self.config = self._load_default_config()
+            self._dirty = True
+            self.version += 1
         self.save()
     
+    def get_section(self, section):
+        """Get a read-only view of a section's options, empty if it doesn't exist; use set() to change it"""
+        return MappingProxyType(self.config.get(section, {}))
+    
     def get_all(self):
-        """Get entire configuration dictionary"""
-        return self.config.copy()
+        """Get a read-only view of the entire configuration; use set() to change it"""
+        return MappingProxyType({
+            section: MappingProxyType(options) if isinstance(options, dict) else options
+            for section, options in self.config.items()
+        })
     
     def update_section(self, section, options):
         """Update multiple options in a section at once"""
-        if section not in self.config:
-            self.config[section] = {}
-        self.config[section].update(options)
\ No newline at end of file
+        with self._save_lock:
+            if section not in self.config:
+                self.config[section] = {}
+            self.config[section].update(options)
+            self._dirty = True
+            self.version += 1
+
+
+class CachedConfig:
+    """Read-through cache in front of a Config, for UI code that reads options often"""
+    
+    def __init__(self, config: Config):
+        """
+        Wrap a configuration object
+        
+        Args:
+            config (Config): Configuration to cache reads from
+        """
+        self._config = config
+        self._cache = {}
+        self._version = config.version
+    
+    def get(self, section, option, default=None):
+        """Get configuration value with fallback to default"""
+        # Any change to the wrapped config, from any component, invalidates the cache
+        if self._config.version != self._version:
+            self._cache.clear()
+            self._version = self._config.version
+        
+        key = (section, option)
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._config.get(section, option, _MISSING)
+        
+        return default if value is _MISSING else value
+    
+    def __getattr__(self, name):
+        """Forward everything else to the wrapped config"""
+        return getattr(self._config, name)
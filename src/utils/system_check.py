@@ -5,6 +5,7 @@ Verifies if the current system meets the minimum requirements for the applicatio
 
 import os
 import platform
+import importlib.util
 import psutil
 import sys
 from pathlib import Path
@@ -23,6 +24,41 @@ class SystemChecker:
             "python_version": (3, 8),
             "windows_version": (10, 0) if platform.system() == "Windows" else None
         }
+        
+        # Total RAM and physical cores are fixed, so query psutil only once
+        self._ram_gb = psutil.virtual_memory().total / (1024 ** 3)
+        self._cpu_count = psutil.cpu_count(logical=False) or 1
+        
+        # Results of the slower probes, filled in on first use
+        self._static = None
+        self._system_info = None
+    
+    def _static_checks(self):
+        """
+        Gather the fixed system facts the requirement checks use
+        
+        Hardware, platform and installed libraries don't change while the
+        process runs, so they are probed once per checker. Free disk space
+        does change and is read on every verify_requirements().
+        
+        Returns:
+            tuple: (ram_gb, cpu_count, py_version, win_version, missing_libs),
+                where win_version is None if unavailable
+        """
+        if self._static is not None:
+            return self._static
+        
+        win_version = None
+        if platform.system() == "Windows":
+            try:
+                win_ver = sys.getwindowsversion()
+                win_version = (win_ver.major, win_ver.minor, win_ver.build)
+            except Exception:
+                pass
+        
+        self._static = (self._ram_gb, self._cpu_count, sys.version_info[:2],
+                        win_version, self._check_required_libraries())
+        return self._static
     
     def verify_requirements(self):
         """
@@ -32,14 +68,13 @@ class SystemChecker:
             tuple: (requirements_met, issues_list)
         """
         issues = []
+        ram_gb, cpu_count, current_python, win_version, missing_libs = self._static_checks()
         
         # Check RAM
-        available_ram = psutil.virtual_memory().total / (1024 ** 3)  # GB
-        if available_ram < self.min_requirements["ram_gb"]:
-            issues.append(f"RAM: {available_ram:.1f} GB (minimum {self.min_requirements['ram_gb']} GB)")
+        if ram_gb < self.min_requirements["ram_gb"]:
+            issues.append(f"RAM: {ram_gb:.1f} GB (minimum {self.min_requirements['ram_gb']} GB)")
         
         # Check CPU
-        cpu_count = psutil.cpu_count(logical=False) or 1
         if cpu_count < self.min_requirements["cpu_cores"]:
             issues.append(f"CPU: {cpu_count} cores (minimum {self.min_requirements['cpu_cores']} cores)")
         
@@ -53,7 +88,6 @@ class SystemChecker:
             issues.append("Could not determine available disk space")
         
         # Check Python version
-        current_python = sys.version_info[:2]
         if current_python < self.min_requirements["python_version"]:
             py_min = ".".join(map(str, self.min_requirements["python_version"]))
             py_current = ".".join(map(str, current_python))
@@ -61,18 +95,14 @@ class SystemChecker:
         
         # Check Windows version if on Windows
         if platform.system() == "Windows" and self.min_requirements["windows_version"]:
-            try:
-                win_ver = sys.getwindowsversion()
-                current_windows = (win_ver.major, win_ver.minor)
-                if current_windows < self.min_requirements["windows_version"]:
-                    win_min = ".".join(map(str, self.min_requirements["windows_version"]))
-                    win_current = ".".join(map(str, current_windows))
-                    issues.append(f"Windows: {win_current} (minimum {win_min})")
-            except Exception:
+            if win_version is None:
                 issues.append("Could not determine Windows version")
+            elif win_version[:2] < self.min_requirements["windows_version"]:
+                win_min = ".".join(map(str, self.min_requirements["windows_version"]))
+                win_current = ".".join(map(str, win_version[:2]))
+                issues.append(f"Windows: {win_current} (minimum {win_min})")
         
         # Check for required libraries
-        missing_libs = self._check_required_libraries()
         if missing_libs:
             issues.append(f"Missing libraries: {', '.join(missing_libs)}")
         
@@ -89,40 +119,41 @@ class SystemChecker:
         if platform.system() == "Windows":
             required_libs.append("win32api")
         
+        # find_spec locates modules without executing them, so heavy
+        # packages like pandas and selenium aren't loaded just to be probed
         missing = []
         for lib in required_libs:
             try:
-                if lib == "bs4":
-                    __import__("bs4")
-                elif lib == "win32api":
-                    # Only check on Windows
-                    if platform.system() == "Windows":
-                        __import__("win32api")
-                else:
-                    __import__(lib)
-            except ImportError:
+                if importlib.util.find_spec(lib) is None:
+                    missing.append(lib)
+            except (ImportError, ValueError):
                 missing.append(lib)
         
-        return missing
+        return tuple(missing)
     
     def get_system_info(self):
         """Get detailed system information for diagnostics"""
+        if self._system_info is None:
+            self._system_info = self._collect_system_info()
+        
+        # Copy so callers can't modify the cached result
+        return dict(self._system_info)
+    
+    def _collect_system_info(self):
+        """Collect system information, called once per checker"""
         info = {
             "platform": platform.system(),
             "platform_release": platform.release(),
             "platform_version": platform.version(),
             "architecture": platform.machine(),
             "processor": platform.processor(),
-            "ram": f"{psutil.virtual_memory().total / (1024 ** 3):.2f} GB",
+            "ram": f"{self._ram_gb:.2f} GB",
             "python_version": platform.python_version(),
         }
         
         if platform.system() == "Windows":
-            try:
-                win_ver = sys.getwindowsversion()
-                info["windows_version"] = f"{win_ver.major}.{win_ver.minor}.{win_ver.build}"
-            except Exception:
-                info["windows_version"] = "Unknown"
+            win_version = self._static_checks()[3]
+            info["windows_version"] = ".".join(map(str, win_version)) if win_version else "Unknown"
         
         return info
     
@@ -133,8 +164,8 @@ class SystemChecker:
         Returns:
             str: 'low', 'medium', or 'high'
         """
-        ram_gb = psutil.virtual_memory().total / (1024 ** 3)
-        cpu_count = psutil.cpu_count(logical=False) or 1
+        ram_gb = self._ram_gb
+        cpu_count = self._cpu_count
         
         if ram_gb >= 8 and cpu_count >= 4:
             return "high"
@@ -151,8 +182,8 @@ class SystemChecker:
             dict: Recommended settings for the current system
         """
         profile = self.estimate_performance_profile()
-        ram_gb = psutil.virtual_memory().total / (1024 ** 3)
-        cpu_count = psutil.cpu_count(logical=False) or 1
+        ram_gb = self._ram_gb
+        cpu_count = self._cpu_count
         
         settings = {
             "system": {